@@ -1,3 +1,4 @@
+import os
 import shutil
 from pathlib import Path
 from typing import Dict, Any, List
@@ -23,6 +24,8 @@ class EventlogsModule(ICollectionModule):
         'Microsoft-Windows-Sysmon%4Operational.evtx',
     ]
 
+    _INVENTORY_ROW = '{path:<60} {size:>10.2f}\n'.format_map
+
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         self.logger = get_logger()
@@ -113,23 +116,25 @@ class EventlogsModule(ICollectionModule):
         try:
             critical_dir = self.output_dir / "critical"
             critical_dir.mkdir(exist_ok=True)
+            critical_dir_str = str(critical_dir)
+            logs_dir_str = str(self.LOGS_DIR)
 
             collected_count = 0
 
             for log_name in self.CRITICAL_LOGS:
-                log_path = self.LOGS_DIR / log_name
+                log_path = os.path.join(logs_dir_str, log_name)
 
-                if log_path.exists():
+                if os.path.exists(log_path):
                     try:
                         safe_name = log_name.replace('%4', '_')
-                        dest_path = critical_dir / safe_name
+                        dest_path = os.path.join(critical_dir_str, safe_name)
 
                         shutil.copy2(log_path, dest_path)
 
-                        self.collected_files.append(dest_path)
+                        self.collected_files.append(Path(dest_path))
                         collected_count += 1
 
-                        size_mb = dest_path.stat().st_size / (1024 * 1024)
+                        size_mb = os.stat(dest_path).st_size / (1024 * 1024)
                         self.logger.info(
                             f"Collected {log_name} ({size_mb:.2f}MB)",
                             module="EventlogsModule"
@@ -166,18 +171,22 @@ class EventlogsModule(ICollectionModule):
         try:
             all_logs_dir = self.output_dir / "all"
             all_logs_dir.mkdir(exist_ok=True)
+            all_logs_dir_str = str(all_logs_dir)
+            critical_logs = frozenset(self.CRITICAL_LOGS)
 
             collected_count = 0
             total_size_mb = 0
             max_size_gb = 2
 
-            for log_file in self.LOGS_DIR.iterdir():
-                if not log_file.is_file() or not log_file.suffix == '.evtx':
-                    continue
-
-                if log_file.name in self.CRITICAL_LOGS:
-                    continue
+            with os.scandir(self.LOGS_DIR) as entries:
+                log_entries = [
+                    entry for entry in entries
+                    if entry.name.endswith('.evtx')
+                    and entry.name not in critical_logs
+                    and entry.is_file()
+                ]
 
+            for log_file in log_entries:
                 size_mb = log_file.stat().st_size / (1024 * 1024)
                 if total_size_mb + size_mb > (max_size_gb * 1024):
                     self.logger.warning(
@@ -188,11 +197,11 @@ class EventlogsModule(ICollectionModule):
 
                 try:
                     safe_name = log_file.name.replace('%4', '_')
-                    dest_path = all_logs_dir / safe_name
+                    dest_path = os.path.join(all_logs_dir_str, safe_name)
 
-                    shutil.copy2(log_file, dest_path)
+                    shutil.copy2(log_file.path, dest_path)
 
-                    self.collected_files.append(dest_path)
+                    self.collected_files.append(Path(dest_path))
                     collected_count += 1
                     total_size_mb += size_mb
 
@@ -219,28 +228,40 @@ class EventlogsModule(ICollectionModule):
         try:
             inventory_file = self.output_dir / "logs_inventory.txt"
 
+            sizes = {}
+            for file_path in self.collected_files:
+                try:
+                    sizes[file_path] = file_path.stat().st_size
+                except OSError:
+                    continue
+
+            total_size = sum(sizes.values())
+            row = self._INVENTORY_ROW
+            rows = [
+                row({
+                    'path': str(file_path.relative_to(self.output_dir)),
+                    'size': size / (1024 * 1024)
+                })
+                for file_path, size in sorted(sizes.items())
+            ]
+
+            lines = [
+                "Event Logs Inventory\n",
+                "=" * 80 + "\n\n",
+                "Collection Summary:\n",
+                "-" * 80 + "\n",
+                f"Total Files Collected: {len(self.collected_files)}\n",
+                f"Total Size: {total_size / (1024*1024):.2f} MB\n",
+                "\n",
+                "Collected Files:\n",
+                "-" * 80 + "\n",
+                f"{'File Name':<60} {'Size (MB)':<15}\n",
+                "-" * 80 + "\n",
+            ]
+
             with open(inventory_file, 'w', encoding='utf-8') as f:
-                f.write("Event Logs Inventory\n")
-                f.write("=" * 80 + "\n\n")
-
-                f.write("Collection Summary:\n")
-                f.write("-" * 80 + "\n")
-                f.write(f"Total Files Collected: {len(self.collected_files)}\n")
-
-                total_size = sum(f.stat().st_size for f in self.collected_files if f.exists())
-                f.write(f"Total Size: {total_size / (1024*1024):.2f} MB\n")
-                f.write("\n")
-
-                f.write("Collected Files:\n")
-                f.write("-" * 80 + "\n")
-                f.write(f"{'File Name':<60} {'Size (MB)':<15}\n")
-                f.write("-" * 80 + "\n")
-
-                for file_path in sorted(self.collected_files):
-                    if file_path.exists():
-                        size_mb = file_path.stat().st_size / (1024 * 1024)
-                        rel_path = file_path.relative_to(self.output_dir)
-                        f.write(f"{str(rel_path):<60} {size_mb:>10.2f}\n")
+                f.write(''.join(lines))
+                f.write(''.join(rows))
 
             self.collected_files.append(inventory_file)
 
@@ -1,16 +1,155 @@
 import psutil
 import subprocess
 import platform
+import io
 import os
+import sys
 from pathlib import Path
-from typing import Dict, Any
-import json
+from typing import Dict, Any, List, Iterator
+from contextlib import contextmanager
+from collections import namedtuple
 import csv
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import time
 
 from src.modules.base_module import ICollectionModule, ModuleStatus
 from src.services.logger import get_logger
-from src.services.hash_calculator import HashCalculator
+from src.services.hash_calculator import HashCalculator, HashingWriter
+from src.utils.console import console_to_utf8
+from src.utils.json_writer import dumps_compact, dumps_indented
+
+
+_WRITE_BUFFER_SIZE = 1024 * 1024
+
+_TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# Report headers use the same line ending as the console output after them.
+_LINESEP = os.linesep.encode()
+
+_PROCESS_CSV_HEADER = (
+    b"PID,Name,Executable Path,Command Line,Parent PID,Username,"
+    b"Status,CPU %,Memory MB,Threads,Created Time\r\n"
+)
+
+
+def _csv_field(value) -> str:
+    if value is None:
+        return ''
+    value = str(value)
+    if ',' in value or '"' in value or '\n' in value or '\r' in value:
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
+# services.csv keeps the wmic spellings it had when wmic produced it.
+_WMIC_START_MODES = {
+    'automatic': 'Auto',
+    'manual': 'Manual',
+    'disabled': 'Disabled',
+    'boot': 'Boot',
+    'system': 'System',
+}
+_WMIC_STATES = {
+    'running': 'Running',
+    'stopped': 'Stopped',
+    'paused': 'Paused',
+    'start_pending': 'Start Pending',
+    'stop_pending': 'Stop Pending',
+    'continue_pending': 'Continue Pending',
+    'pause_pending': 'Pause Pending',
+}
+
+_PROCESS_ATTRS = [
+    'pid', 'name', 'exe', 'cmdline', 'ppid',
+    'username', 'status', 'cpu_percent',
+    'memory_info', 'num_threads', 'create_time'
+]
+
+_PROC_STATES = {
+    'R': psutil.STATUS_RUNNING,
+    'S': psutil.STATUS_SLEEPING,
+    'D': psutil.STATUS_DISK_SLEEP,
+    'T': psutil.STATUS_STOPPED,
+    't': psutil.STATUS_TRACING_STOP,
+    'Z': psutil.STATUS_ZOMBIE,
+    'X': psutil.STATUS_DEAD,
+    'I': psutil.STATUS_IDLE,
+    'P': psutil.STATUS_PARKED,
+}
+
+_ProcMemory = namedtuple('_ProcMemory', ['rss'])
+
+
+def _iter_proc_processes() -> Iterator[Dict[str, Any]]:
+    """Read the process table straight from /proc on Linux."""
+    import pwd
+
+    boot_time = psutil.boot_time()
+    clock_ticks = os.sysconf('SC_CLK_TCK')
+    page_size = os.sysconf('SC_PAGE_SIZE')
+    usernames = {}
+
+    with os.scandir('/proc') as entries:
+        pids = [int(entry.name) for entry in entries if entry.name.isdigit()]
+
+    for pid in pids:
+        proc_dir = f'/proc/{pid}'
+        try:
+            with open(f'{proc_dir}/stat', 'rb') as f:
+                stat = f.read()
+            with open(f'{proc_dir}/cmdline', 'rb') as f:
+                cmdline = [os.fsdecode(arg) for arg in f.read().split(b'\0') if arg]
+            uid = os.stat(proc_dir).st_uid
+        except (FileNotFoundError, ProcessLookupError, PermissionError):
+            continue
+
+        try:
+            exe = os.readlink(f'{proc_dir}/exe')
+        except FileNotFoundError:
+            exe = ''
+        except OSError:
+            exe = None
+
+        if uid not in usernames:
+            try:
+                usernames[uid] = pwd.getpwuid(uid).pw_name
+            except KeyError:
+                usernames[uid] = str(uid)
+
+        name_end = stat.rindex(b')')
+        fields = stat[name_end + 2:].split()
+        state = fields[0].decode()
+
+        name = os.fsdecode(stat[stat.index(b'(') + 1:name_end])
+        if len(name) >= 15 and cmdline:
+            # The kernel truncates comm to 15 characters; extend it from
+            # argv[0] the same way psutil.Process.name() does.
+            extended_name = os.path.basename(cmdline[0])
+            if extended_name.startswith(name):
+                name = extended_name
+
+        yield {
+            'pid': pid,
+            'name': name,
+            'exe': exe,
+            'cmdline': cmdline,
+            'ppid': int(fields[1]),
+            'username': usernames[uid],
+            'status': _PROC_STATES.get(state, state),
+            'cpu_percent': 0.0,
+            'memory_info': _ProcMemory(int(fields[21]) * page_size),
+            'num_threads': int(fields[17]),
+            'create_time': boot_time + int(fields[19]) / clock_ticks,
+        }
+
+
+def _iter_process_info() -> Iterator[Dict[str, Any]]:
+    if sys.platform.startswith('linux'):
+        yield from _iter_proc_processes()
+        return
+
+    for proc in psutil.process_iter(_PROCESS_ATTRS):
+        yield proc.info
 
 
 class LiveSystemModule(ICollectionModule):
@@ -20,11 +159,36 @@ class LiveSystemModule(ICollectionModule):
         self.hash_calculator = HashCalculator()
         self.output_dir = Path(config.get("output_dir", "live_system"))
         self.collected_files = []
+        self.written_hashes: Dict[Path, Dict[str, str]] = {}
+
+    def _hash_algorithms(self) -> List[str]:
+        return [
+            alg for alg in self.config.get("hash_algorithms", ["md5", "sha256"])
+            if alg in self.hash_calculator.supported_algorithms
+        ]
+
+    @contextmanager
+    def _hashed_output(self, file_path: Path) -> Iterator[HashingWriter]:
+        writer = HashingWriter(
+            open(file_path, 'wb', buffering=_WRITE_BUFFER_SIZE),
+            self._hash_algorithms()
+        )
+        with writer:
+            yield writer
+        self.written_hashes[file_path] = writer.hexdigests()
+
+    def _write_output(self, file_path: Path, data: bytes):
+        with self._hashed_output(file_path) as out:
+            out.write(data)
 
     def initialize(self) -> bool:
         try:
             self.output_dir.mkdir(parents=True, exist_ok=True)
 
+            # Prime the CPU counters so the system info snapshot can sample
+            # without blocking for a full interval.
+            psutil.cpu_percent(interval=None)
+
             self.logger.info(
                 f"Live system module initialized, output: {self.output_dir}",
                 module="LiveSystemModule"
@@ -48,29 +212,26 @@ class LiveSystemModule(ICollectionModule):
             self.status = ModuleStatus.RUNNING
             self.progress = 0
 
-            self.logger.info("Collecting process information...", module="LiveSystemModule")
-            self._collect_processes()
-            self.progress = 15
-
-            self.logger.info("Collecting services...", module="LiveSystemModule")
-            self._collect_services()
-            self.progress = 30
+            collectors = [
+                ("process information", self._collect_processes),
+                ("services", self._collect_services),
+                ("scheduled tasks", self._collect_scheduled_tasks),
+                ("logged-in users", self._collect_users),
+                ("system information", self._collect_system_info),
+                ("environment variables", self._collect_environment),
+            ]
 
-            self.logger.info("Collecting scheduled tasks...", module="LiveSystemModule")
-            self._collect_scheduled_tasks()
-            self.progress = 45
+            with ThreadPoolExecutor(max_workers=len(collectors)) as executor:
+                futures = []
+                for description, collector in collectors:
+                    self.logger.info(f"Collecting {description}...", module="LiveSystemModule")
+                    futures.append(executor.submit(collector))
 
-            self.logger.info("Collecting logged-in users...", module="LiveSystemModule")
-            self._collect_users()
-            self.progress = 60
+                for done, _ in enumerate(as_completed(futures), 1):
+                    self.progress = int(done / len(collectors) * 90)
 
-            self.logger.info("Collecting system information...", module="LiveSystemModule")
-            self._collect_system_info()
-            self.progress = 75
-
-            self.logger.info("Collecting environment variables...", module="LiveSystemModule")
-            self._collect_environment()
-            self.progress = 90
+            for future in futures:
+                self.collected_files.extend(future.result())
 
             self.logger.info("Calculating hashes...", module="LiveSystemModule")
             self._calculate_hashes()
@@ -93,35 +254,20 @@ class LiveSystemModule(ICollectionModule):
             self.error_message = str(e)
             return False
 
-    def _collect_processes(self):
+    def _collect_processes(self) -> List[Path]:
+        collected = []
+
         try:
             csv_file = self.output_dir / "processes.csv"
+            json_file = self.output_dir / "processes.json"
 
-            with open(csv_file, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
+            buf = bytearray(_PROCESS_CSV_HEADER)
+            with self._hashed_output(json_file) as json_out:
+                json_out.write(b'[')
+                separator = b''
 
-                writer.writerow([
-                    'PID',
-                    'Name',
-                    'Executable Path',
-                    'Command Line',
-                    'Parent PID',
-                    'Username',
-                    'Status',
-                    'CPU %',
-                    'Memory MB',
-                    'Threads',
-                    'Created Time'
-                ])
-
-                for proc in psutil.process_iter([
-                    'pid', 'name', 'exe', 'cmdline', 'ppid',
-                    'username', 'status', 'cpu_percent',
-                    'memory_info', 'num_threads', 'create_time'
-                ]):
+                for pinfo in _iter_process_info():
                     try:
-                        pinfo = proc.info
-
                         pid = pinfo.get('pid', '')
                         name = pinfo.get('name', '')
                         exe = pinfo.get('exe', 'N/A')
@@ -141,130 +287,151 @@ class LiveSystemModule(ICollectionModule):
                         num_threads = pinfo.get('num_threads', 0)
 
                         create_time = pinfo.get('create_time', 0)
-                        created = datetime.fromtimestamp(create_time).strftime('%Y-%m-%d %H:%M:%S') if create_time else 'N/A'
-
-                        writer.writerow([
-                            pid, name, exe, cmdline_str, ppid,
-                            username, status, cpu_percent, memory_mb,
-                            num_threads, created
-                        ])
+                        created = (
+                            time.strftime(_TIME_FORMAT, time.localtime(create_time))
+                            if create_time else 'N/A'
+                        )
+
+                        buf += (
+                            f"{pid},{_csv_field(name)},{_csv_field(exe)},"
+                            f"{_csv_field(cmdline_str)},{_csv_field(ppid)},{_csv_field(username)},"
+                            f"{_csv_field(status)},{_csv_field(cpu_percent)},{memory_mb},"
+                            f"{_csv_field(num_threads)},{created}\r\n"
+                        ).encode('utf-8')
+
+                        json_out.write(separator + dumps_compact({
+                            "pid": pinfo.get('pid'),
+                            "name": pinfo.get('name'),
+                            "exe": pinfo.get('exe'),
+                            "cmdline": pinfo.get('cmdline'),
+                            "ppid": pinfo.get('ppid'),
+                            "username": pinfo.get('username')
+                        }))
+                        separator = b','
 
                     except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
                         continue
 
-            self.collected_files.append(csv_file)
-            self.logger.info(f"Processes saved to: {csv_file}", module="LiveSystemModule")
+                json_out.write(b']')
 
-            json_file = self.output_dir / "processes.json"
-            processes_data = []
-
-            for proc in psutil.process_iter(['pid', 'name', 'exe', 'cmdline', 'ppid', 'username']):
-                try:
-                    pinfo = proc.info
-                    processes_data.append({
-                        "pid": pinfo.get('pid'),
-                        "name": pinfo.get('name'),
-                        "exe": pinfo.get('exe'),
-                        "cmdline": pinfo.get('cmdline'),
-                        "ppid": pinfo.get('ppid'),
-                        "username": pinfo.get('username')
-                    })
-                except:
-                    continue
-
-            with open(json_file, 'w', encoding='utf-8') as f:
-                json.dump(processes_data, f, indent=4, ensure_ascii=False)
+            self._write_output(csv_file, buf)
+            collected.append(csv_file)
+            self.logger.info(f"Processes saved to: {csv_file}", module="LiveSystemModule")
 
-            self.collected_files.append(json_file)
+            collected.append(json_file)
 
         except Exception as e:
             self.logger.error(f"Failed to collect processes: {e}", module="LiveSystemModule")
 
-    def _collect_services(self):
+        return collected
+
+    def _collect_services(self) -> List[Path]:
+        collected = []
+
         try:
             output_file = self.output_dir / "services.txt"
 
             result = subprocess.run(
                 ['sc', 'query', 'state=', 'all'],
-                capture_output=True,
-                text=True,
-                encoding='cp437'
+                capture_output=True
             )
 
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write("Windows Services\n")
-                f.write("=" * 80 + "\n\n")
-                f.write(result.stdout)
+            self._write_output(
+                output_file,
+                b"Windows Services" + _LINESEP + b"=" * 80 + _LINESEP * 2
+                + console_to_utf8(result.stdout)
+            )
 
-            self.collected_files.append(output_file)
+            collected.append(output_file)
             self.logger.info(f"Services saved to: {output_file}", module="LiveSystemModule")
 
-            self._collect_services_detailed()
+            collected.extend(self._collect_services_detailed())
 
         except Exception as e:
             self.logger.error(f"Failed to collect services: {e}", module="LiveSystemModule")
 
-    def _collect_services_detailed(self):
+        return collected
+
+    def _collect_services_detailed(self) -> List[Path]:
+        collected = []
+
         try:
             csv_file = self.output_dir / "services.csv"
 
-            result = subprocess.run(
-                ['wmic', 'service', 'get',
-                 'Name,DisplayName,State,StartMode,PathName',
-                 '/format:csv'],
-                capture_output=True,
-                text=True,
-                encoding='cp437'
-            )
+            node = platform.node()
 
-            with open(csv_file, 'w', encoding='utf-8') as f:
-                f.write(result.stdout)
+            with self._hashed_output(csv_file) as out, \
+                    io.TextIOWrapper(out, encoding='utf-8', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(['Node', 'DisplayName', 'Name', 'PathName', 'StartMode', 'State'])
 
-            self.collected_files.append(csv_file)
+                for service in psutil.win_service_iter():
+                    try:
+                        sinfo = service.as_dict()
+                    except (psutil.NoSuchProcess, psutil.AccessDenied):
+                        continue
+
+                    start_type = sinfo.get('start_type', '')
+                    status = sinfo.get('status', '')
+                    writer.writerow([
+                        node,
+                        sinfo.get('display_name', ''),
+                        sinfo.get('name', ''),
+                        sinfo.get('binpath', ''),
+                        _WMIC_START_MODES.get(start_type, start_type),
+                        _WMIC_STATES.get(status, status)
+                    ])
+
+            collected.append(csv_file)
 
         except Exception as e:
             self.logger.error(f"Failed to collect detailed services: {e}", module="LiveSystemModule")
 
-    def _collect_scheduled_tasks(self):
+        return collected
+
+    def _collect_scheduled_tasks(self) -> List[Path]:
+        collected = []
+
         try:
             output_file = self.output_dir / "scheduled_tasks.txt"
 
             result = subprocess.run(
                 ['schtasks', '/query', '/fo', 'LIST', '/v'],
-                capture_output=True,
-                text=True,
-                encoding='cp437'
+                capture_output=True
             )
 
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write("Scheduled Tasks\n")
-                f.write("=" * 80 + "\n\n")
-                f.write(result.stdout)
+            self._write_output(
+                output_file,
+                b"Scheduled Tasks" + _LINESEP + b"=" * 80 + _LINESEP * 2
+                + console_to_utf8(result.stdout)
+            )
 
-            self.collected_files.append(output_file)
+            collected.append(output_file)
             self.logger.info(f"Scheduled tasks saved to: {output_file}", module="LiveSystemModule")
 
             csv_file = self.output_dir / "scheduled_tasks.csv"
             result_csv = subprocess.run(
                 ['schtasks', '/query', '/fo', 'CSV', '/v'],
-                capture_output=True,
-                text=True,
-                encoding='cp437'
+                capture_output=True
             )
 
-            with open(csv_file, 'w', encoding='utf-8') as f:
-                f.write(result_csv.stdout)
+            self._write_output(csv_file, console_to_utf8(result_csv.stdout))
 
-            self.collected_files.append(csv_file)
+            collected.append(csv_file)
 
         except Exception as e:
             self.logger.error(f"Failed to collect scheduled tasks: {e}", module="LiveSystemModule")
 
-    def _collect_users(self):
+        return collected
+
+    def _collect_users(self) -> List[Path]:
+        collected = []
+
         try:
             output_file = self.output_dir / "users.txt"
 
-            with open(output_file, 'w', encoding='utf-8') as f:
+            with self._hashed_output(output_file) as out, \
+                    io.TextIOWrapper(out, encoding='utf-8') as f:
                 f.write("Logged-in Users\n")
                 f.write("=" * 80 + "\n\n")
 
@@ -275,7 +442,7 @@ class LiveSystemModule(ICollectionModule):
                     f.write("-" * 80 + "\n")
 
                     for user in users:
-                        started = datetime.fromtimestamp(user.started).strftime('%Y-%m-%d %H:%M:%S')
+                        started = time.strftime(_TIME_FORMAT, time.localtime(user.started))
                         f.write(f"{user.name:<20} {user.terminal or 'N/A':<15} "
                                f"{user.host or 'localhost':<20} {started:<20}\n")
                 else:
@@ -286,25 +453,27 @@ class LiveSystemModule(ICollectionModule):
                 try:
                     result = subprocess.run(
                         ['query', 'user'],
-                        capture_output=True,
-                        text=True,
-                        encoding='cp437'
+                        capture_output=True
                     )
 
                     if result.returncode == 0:
                         f.write("Query User Output:\n")
                         f.write("-" * 80 + "\n")
-                        f.write(result.stdout)
+                        f.write(result.stdout.decode('cp437').replace('\r\n', '\n'))
                 except:
                     pass
 
-            self.collected_files.append(output_file)
+            collected.append(output_file)
             self.logger.info(f"Users saved to: {output_file}", module="LiveSystemModule")
 
         except Exception as e:
             self.logger.error(f"Failed to collect users: {e}", module="LiveSystemModule")
 
-    def _collect_system_info(self):
+        return collected
+
+    def _collect_system_info(self) -> List[Path]:
+        collected = []
+
         try:
             output_file = self.output_dir / "system_info.json"
 
@@ -319,12 +488,13 @@ class LiveSystemModule(ICollectionModule):
                 'hostname': platform.node()
             }
 
+            cpu_freq = psutil.cpu_freq()
             system_info['cpu'] = {
                 'physical_cores': psutil.cpu_count(logical=False),
                 'logical_cores': psutil.cpu_count(logical=True),
-                'max_frequency': psutil.cpu_freq().max if psutil.cpu_freq() else None,
-                'current_frequency': psutil.cpu_freq().current if psutil.cpu_freq() else None,
-                'cpu_percent': psutil.cpu_percent(interval=1)
+                'max_frequency': cpu_freq.max if cpu_freq else None,
+                'current_frequency': cpu_freq.current if cpu_freq else None,
+                'cpu_percent': psutil.cpu_percent(interval=None)
             }
 
             memory = psutil.virtual_memory()
@@ -335,25 +505,32 @@ class LiveSystemModule(ICollectionModule):
                 'percent': memory.percent
             }
 
+            partitions = [
+                partition for partition in psutil.disk_partitions(all=False)
+                if 'cdrom' not in partition.opts and 'removable' not in partition.opts
+            ]
+
+            with ThreadPoolExecutor(max_workers=len(partitions) or 1) as executor:
+                usages = list(executor.map(self._partition_usage, partitions))
+
             system_info['disks'] = []
-            for partition in psutil.disk_partitions():
-                try:
-                    usage = psutil.disk_usage(partition.mountpoint)
-                    system_info['disks'].append({
-                        'device': partition.device,
-                        'mountpoint': partition.mountpoint,
-                        'fstype': partition.fstype,
-                        'total_gb': round(usage.total / (1024**3), 2),
-                        'used_gb': round(usage.used / (1024**3), 2),
-                        'free_gb': round(usage.free / (1024**3), 2),
-                        'percent': usage.percent
-                    })
-                except:
+            for partition, usage in zip(partitions, usages):
+                if usage is None:
                     continue
 
+                system_info['disks'].append({
+                    'device': partition.device,
+                    'mountpoint': partition.mountpoint,
+                    'fstype': partition.fstype,
+                    'total_gb': round(usage.total / (1024**3), 2),
+                    'used_gb': round(usage.used / (1024**3), 2),
+                    'free_gb': round(usage.free / (1024**3), 2),
+                    'percent': usage.percent
+                })
+
             boot_time = psutil.boot_time()
-            system_info['boot_time'] = datetime.fromtimestamp(boot_time).strftime('%Y-%m-%d %H:%M:%S')
-            system_info['uptime_seconds'] = int(datetime.now().timestamp() - boot_time)
+            system_info['boot_time'] = time.strftime(_TIME_FORMAT, time.localtime(boot_time))
+            system_info['uptime_seconds'] = int(time.time() - boot_time)
 
             net_io = psutil.net_io_counters()
             system_info['network_stats'] = {
@@ -363,67 +540,90 @@ class LiveSystemModule(ICollectionModule):
                 'packets_recv': net_io.packets_recv
             }
 
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(system_info, f, indent=4, ensure_ascii=False)
+            self._write_output(output_file, dumps_indented(system_info))
 
-            self.collected_files.append(output_file)
+            collected.append(output_file)
             self.logger.info(f"System info saved to: {output_file}", module="LiveSystemModule")
 
         except Exception as e:
             self.logger.error(f"Failed to collect system info: {e}", module="LiveSystemModule")
 
-    def _collect_environment(self):
+        return collected
+
+    def _partition_usage(self, partition):
         try:
-            output_file = self.output_dir / "environment.txt"
+            return psutil.disk_usage(partition.mountpoint)
+        except Exception:
+            return None
 
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write("Environment Variables\n")
-                f.write("=" * 80 + "\n\n")
+    def _collect_environment(self) -> List[Path]:
+        collected = []
+
+        try:
+            output_file = self.output_dir / "environment.txt"
+            json_file = self.output_dir / "environment.json"
+            environment = dict(os.environ)
 
-                for key in sorted(os.environ.keys()):
-                    value = os.environ[key]
-                    f.write(f"{key} = {value}\n")
+            lines = [f"{key} = {environment[key]}" for key in sorted(environment)]
+            self._write_output(
+                output_file,
+                ("Environment Variables\n" + "=" * 80 + "\n\n" + "\n".join(lines) + "\n")
+                .replace("\n", os.linesep).encode('utf-8')
+            )
 
-            self.collected_files.append(output_file)
+            collected.append(output_file)
             self.logger.info(f"Environment saved to: {output_file}", module="LiveSystemModule")
 
-            json_file = self.output_dir / "environment.json"
-            with open(json_file, 'w', encoding='utf-8') as f:
-                json.dump(dict(os.environ), f, indent=4, ensure_ascii=False)
+            self._write_output(json_file, dumps_indented(environment))
 
-            self.collected_files.append(json_file)
+            collected.append(json_file)
 
         except Exception as e:
             self.logger.error(f"Failed to collect environment: {e}", module="LiveSystemModule")
 
+        return collected
+
     def _calculate_hashes(self):
         hash_file = self.output_dir / "hashes.txt"
+        algorithms = self.config.get("hash_algorithms", ["md5", "sha256"])
+        stats = {}
+        for file_path in self.collected_files:
+            try:
+                stats[file_path] = file_path.stat()
+            except OSError:
+                continue
+
+        files = list(stats)
+
+        results_by_file = {
+            file_path: self.written_hashes[file_path]
+            for file_path in files if file_path in self.written_hashes
+        }
+        pending = [file_path for file_path in files if file_path not in results_by_file]
+
+        results_by_file.update(self.hash_calculator.calculate_hashes_for_files(pending, algorithms))
 
-        with open(hash_file, 'w', encoding='utf-8') as f:
+        results = [results_by_file[file_path] for file_path in files]
+
+        with open(hash_file, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
             f.write("File Hashes\n")
             f.write("=" * 80 + "\n\n")
 
-            for file_path in self.collected_files:
-                if file_path.exists():
-                    hashes = self.hash_calculator.calculate_file_hashes(
-                        file_path,
-                        self.config.get("hash_algorithms", ["md5", "sha256"])
-                    )
-
-                    f.write(f"File: {file_path.name}\n")
-                    for algo, hash_value in hashes.items():
-                        f.write(f"  {algo.upper()}: {hash_value}\n")
-                    f.write("\n")
-
-                    self.logger.log_collection(
-                        module="LiveSystemModule",
-                        action="File collected",
-                        status="Success",
-                        file_path=str(file_path),
-                        file_size=file_path.stat().st_size,
-                        hash_md5=hashes.get("md5", ""),
-                        hash_sha256=hashes.get("sha256", "")
-                    )
+            for file_path, hashes in zip(files, results):
+                f.write(f"File: {file_path.name}\n")
+                for algo, hash_value in hashes.items():
+                    f.write(f"  {algo.upper()}: {hash_value}\n")
+                f.write("\n")
+
+                self.logger.log_collection(
+                    module="LiveSystemModule",
+                    action="File collected",
+                    status="Success",
+                    file_path=str(file_path),
+                    file_size=stats[file_path].st_size,
+                    hash_md5=hashes.get("md5", ""),
+                    hash_sha256=hashes.get("sha256", "")
+                )
 
     def cleanup(self) -> None:
         self.logger.debug("Live system module cleanup", module="LiveSystemModule")
@@ -1,16 +1,261 @@
+import hashlib
+import os
+import re
+import string
 import subprocess
+import textwrap
+import threading
+from collections import deque
 from pathlib import Path
 from typing import Dict, Any, Optional
-import json
 from datetime import datetime
+from functools import lru_cache
 import time
+import zlib
 
 from src.modules.base_module import ICollectionModule, ModuleStatus
 from src.services.logger import get_logger
-from src.services.hash_calculator import HashCalculator
+from src.services.hash_calculator import HASH_FACTORIES, HashCalculator, HashingWriter
+from src.utils.file_io import open_sequential
+from src.utils.json_writer import write_json
+
+
+# Windows-only Popen flags; both are 0 on other platforms.
+_WINPMEM_CREATION_FLAGS = (
+    getattr(subprocess, "HIGH_PRIORITY_CLASS", 0) | getattr(subprocess, "CREATE_NO_WINDOW", 0)
+)
+_WINPMEM_OUTPUT_LINES = 200
+
+
+class _WinPmemOutput:
+    # Bounded view of one WinPmem console stream, parsed line by line as it
+    # arrives so long acquisitions never hold the full output in memory.
+    # Every "Start" range line is kept; they go into the evidence metadata.
+
+    def __init__(self):
+        self.tail = deque(maxlen=_WINPMEM_OUTPUT_LINES)
+        self.memory_ranges = []
+        self.acquisition_method = "Unknown"
+
+    def drain(self, stream):
+        with stream:
+            for raw_line in stream:
+                self.tail.append(raw_line)
+                if raw_line.startswith(b"Start"):
+                    self.memory_ranges.append(raw_line.decode("utf-8", errors="replace").strip())
+                elif b"Acquitision mode" in raw_line or b"Acquisition mode" in raw_line:
+                    line = raw_line.decode("utf-8", errors="replace")
+                    self.acquisition_method = line.split(":")[-1].strip()
+
+    def text(self) -> str:
+        return b"".join(self.tail).decode("utf-8", errors="replace")
+
+
+def _start_drain(stream) -> tuple:
+    output = _WinPmemOutput()
+    thread = threading.Thread(target=output.drain, args=(stream,), daemon=True)
+    thread.start()
+    return thread, output
+
+
+def _joined_output(thread: threading.Thread, output: _WinPmemOutput) -> str:
+    thread.join()
+    return output.text()
+
+
+@lru_cache(maxsize=1)
+def _winpmem_help(winpmem_path: str) -> str:
+    # Both version probes read the same --help text; run WinPmem for it once.
+    result = subprocess.run([winpmem_path, "--help"], capture_output=True, timeout=10)
+    # latin-1 maps every byte, so an oddly localized build cannot raise here.
+    return (result.stdout + result.stderr).decode("latin-1")
+
+
+_WINPMEM_V3_RE = re.compile(r"Version 3|v3\.")
+# Builds that accept "-" as the output path say so in their usage text
+# ("an output filename of - will write the image to STDOUT").
+_WINPMEM_STDOUT_RE = re.compile(r"\bstdout\b", re.IGNORECASE)
+_PROCESSOR_KEY = r"HARDWARE\DESCRIPTION\System\CentralProcessor\0"
+
+
+def _processor_name() -> str:
+    # Read straight from the registry; platform.processor() shells out to WMI
+    # on Windows.
+    try:
+        import winreg
+
+        with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, _PROCESSOR_KEY) as key:
+            return winreg.QueryValueEx(key, "ProcessorNameString")[0].strip()
+    except (ImportError, OSError):
+        import platform
+
+        return platform.processor()
+
+
+# (os_version prefix, matching architectures or None for any, Volatility 2 profile)
+_PROFILE_RULES = (
+    ("Windows-10", frozenset({"AMD64", "x86_64"}), "Win10x64"),
+    ("Windows-10", None, "Win10x86"),
+    ("Windows-11", None, "Win10x64"),
+)
+_DEFAULT_PROFILE = "WinXPSP2x86"
+
+
+def _volatility_profile(os_version: str, architecture: str) -> str:
+    for prefix, architectures, profile in _PROFILE_RULES:
+        if os_version.startswith(prefix) and (
+            architectures is None or architecture in architectures
+        ):
+            return profile
+    return _DEFAULT_PROFILE
+
+
+_INSTRUCTIONS_HEADER_TEMPLATE = string.Template(textwrap.dedent("""
+    ╔═══════════════════════════════════════════════════════════════════════╗
+    ║           Memory Acquisition Instructions                             ║
+    ╚═══════════════════════════════════════════════════════════════════════╝
+
+    $status
+
+    Expected Location:
+    ------------------
+    $winpmem_path
+
+    📥 How to Download WinPmem:
+    ---------------------------
+    1. Visit: https://github.com/Velocidex/WinPmem/releases
+    2. Download the latest release (winpmem_mini_x64_*.exe)
+    3. Rename to: winpmem.exe
+    4. Place at: $winpmem_dir
+
+    Current directory listing:
+    ----------------------------------------
+    """))
+
+_INSTRUCTIONS_FOOTER_TEMPLATE = string.Template(textwrap.dedent("""
+
+    💡 Manual Memory Acquisition:
+    ------------------------------
+    If you have WinPmem installed elsewhere, you can run it manually:
+
+    1. Open Command Prompt as Administrator
+    2. Navigate to WinPmem location
+    3. Run: winpmem.exe memory.raw
+    4. Place memory.raw in: $output_dir
+
+    📋 Alternative Tools:
+    ---------------------
+    1. DumpIt (Magnet Forensics)
+    Download: https://www.magnetforensics.com/
+
+    2. FTK Imager (AccessData)
+    Download: https://www.exterro.com/
+
+    3. Belkasoft RAM Capturer
+    Download: https://belkasoft.com/ram-capturer
+
+    For Volatility Analysis:
+    ------------------------
+    vol.py -f memory.raw windows.info
+    vol.py -f memory.raw windows.pslist
+    vol.py -f memory.raw windows.netscan
+    """))
+
+_VOLATILITY_GUIDE_TEMPLATE = string.Template("""
+Volatility Analysis Guide
+==========================
+
+Memory Image: $memory_file
+Size: $size_gb GB
+Acquired: $acquisition_time
+
+System Information:
+-------------------
+OS: $os $os_release
+Version: $os_version
+Architecture: $architecture
+Total Memory: $total_memory_gb GB
+
+Volatility 2.x Commands:
+------------------------
+Profile: $profile
+
+# List processes
+volatility -f $memory_file --profile=$profile pslist
+
+# List network connections
+volatility -f $memory_file --profile=$profile netscan
+
+# Dump process memory
+volatility -f $memory_file --profile=$profile memdump -p PID -D output/
+
+# List DLLs
+volatility -f $memory_file --profile=$profile dlllist
+
+# Find hidden processes
+volatility -f $memory_file --profile=$profile psxview
+
+# Extract command history
+volatility -f $memory_file --profile=$profile cmdscan
+volatility -f $memory_file --profile=$profile consoles
+
+# Registry analysis
+volatility -f $memory_file --profile=$profile hivelist
+volatility -f $memory_file --profile=$profile printkey -K "SAM\\Domains\\Account\\Users"
+
+# Malware detection
+volatility -f $memory_file --profile=$profile malfind
+volatility -f $memory_file --profile=$profile apihooks
+
+
+Volatility 3.x Commands:
+------------------------
+# List processes
+vol.py -f $memory_file windows.pslist
+
+# List network connections
+vol.py -f $memory_file windows.netscan
+
+# Dump process
+vol.py -f $memory_file windows.memmap --pid PID --dump
+
+# List DLLs
+vol.py -f $memory_file windows.dlllist
+
+# Command history
+vol.py -f $memory_file windows.cmdline
+
+# Registry
+vol.py -f $memory_file windows.registry.hivelist
+vol.py -f $memory_file windows.registry.printkey
+
+# Malware detection
+vol.py -f $memory_file windows.malfind
+
+
+Recommended Analysis Workflow:
+-------------------------------
+1. Identify running processes (pslist)
+2. Check network connections (netscan)
+3. Look for hidden/suspicious processes (psxview, malfind)
+4. Extract command history (cmdscan, consoles)
+5. Analyze registry for persistence (printkey)
+6. Dump suspicious process memory for further analysis
+
+For more information:
+- Volatility 2: https://github.com/volatilityfoundation/volatility
+- Volatility 3: https://github.com/volatilityfoundation/volatility3
+- Volatility Cheat Sheet: https://downloads.volatilityfoundation.org/releases/2.4/CheatSheet_v2.4.pdf
+
+""")
 
 
 class MemoryModule(ICollectionModule):
+    STREAM_CHUNK_SIZE = 4 * 1024 * 1024
+    IMAGE_EXTENSIONS = frozenset({"raw", "dmp"})
+    TREE_HASH_SEGMENT_SIZE = 1024 * 1024 * 1024
+    WINPMEM_TIMEOUT = 3600
+
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         self.logger = get_logger()
@@ -19,7 +264,17 @@ class MemoryModule(ICollectionModule):
         self.collected_files = []
 
         self.acquisition_tool = config.get("tool", "winpmem")
+        self.evidence_copy_dir = config.get("evidence_copy_dir")
+        self.tree_hash = config.get("tree_hash", False)
         self.winpmem_version = "2.0"
+        self.image_hashes: Dict[Path, Dict[str, str]] = {}
+        self.winpmem_output: Optional[_WinPmemOutput] = None
+        self.image_sizes: Dict[Path, int] = {}
+        # SHA-256 is the evidentiary hash; BLAKE3 is added for fast spot
+        # checks when the optional blake3 package is installed.
+        self.image_algorithms = [alg for alg in ("sha256", "blake3") if alg in HASH_FACTORIES]
+        self.run_stamp: Optional[str] = None
+        self.run_time_iso: Optional[str] = None
 
     def initialize(self) -> bool:
         try:
@@ -55,6 +310,10 @@ class MemoryModule(ICollectionModule):
             self.status = ModuleStatus.RUNNING
             self.progress = 0
 
+            started = datetime.now()
+            self.run_stamp = started.strftime("%Y%m%d_%H%M%S")
+            self.run_time_iso = started.isoformat()
+
             self.logger.info("Collecting system information...", module="MemoryModule")
             system_info = self._collect_system_info()
             self.progress = 10
@@ -71,6 +330,10 @@ class MemoryModule(ICollectionModule):
 
             self.logger.info("Calculating memory image hash...", module="MemoryModule")
             self._calculate_hashes()
+            self.progress = 95
+
+            if self.evidence_copy_dir:
+                self._copy_to_evidence_storage(memory_file)
             self.progress = 100
 
             self.status = ModuleStatus.COMPLETED
@@ -92,33 +355,207 @@ class MemoryModule(ICollectionModule):
             "os_version": platform.version(),
             "os_release": platform.release(),
             "architecture": platform.machine(),
-            "processor": platform.processor(),
+            "processor": _processor_name(),
             "total_memory_gb": round(psutil.virtual_memory().total / (1024**3), 2),
-            "acquisition_time": datetime.now().isoformat(),
+            "acquisition_time": self.run_time_iso,
         }
 
         info_file = self.output_dir / "system_info.json"
-        with open(info_file, "w", encoding="utf-8") as f:
-            json.dump(info, f, indent=4)
+        write_json(info_file, info)
 
         self.collected_files.append(info_file)
 
         return info
 
-    def _acquire_memory_with_winpmem(self, winpmem_path: Path, output_file: Path) -> bool:
+    def _winpmem_streams_to_stdout(self, winpmem_path: Path) -> bool:
         try:
-            if self.winpmem_version == "3.0":
-                cmd = [str(winpmem_path), str(output_file), "--format", "raw"]
+            return bool(_WINPMEM_STDOUT_RE.search(_winpmem_help(str(winpmem_path))))
+        except (OSError, subprocess.SubprocessError) as e:
+            self.logger.warning(
+                f"Could not read WinPmem usage, writing the image directly: {e}",
+                module="MemoryModule",
+            )
+            return False
+
+    def _stream_memory_with_winpmem(
+        self, winpmem_path: Path, output_file: Path
+    ) -> Optional[subprocess.CompletedProcess]:
+        cmd = [str(winpmem_path), "-"]
+        if self.winpmem_version == "3.0":
+            cmd.extend(["--format", "raw"])
+
+        self.logger.info(
+            f"Starting streamed memory acquisition with command: {' '.join(cmd)}",
+            module="MemoryModule",
+        )
+
+        # Reserve the output before WinPmem starts, so a failure here never
+        # leaves the driver acquiring with nowhere to write.
+        try:
+            raw_out = open(output_file, "wb", opener=open_sequential)
+        except OSError as e:
+            self.logger.warning(f"Could not create memory image: {e}", module="MemoryModule")
+            return None
+
+        self._preallocate(raw_out.fileno(), self._expected_image_size())
+
+        try:
+            process = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                creationflags=_WINPMEM_CREATION_FLAGS,
+            )
+        except OSError as e:
+            raw_out.close()
+            output_file.unlink(missing_ok=True)
+            self.logger.warning(f"Could not start WinPmem: {e}", module="MemoryModule")
+            return None
+
+        with process:
+            stderr_drain = _start_drain(process.stderr)
+
+            # A blocked read cannot time out on its own; killing WinPmem at the
+            # deadline closes its stdout and ends the loop below.
+            deadline = time.monotonic() + self.WINPMEM_TIMEOUT
+            timed_out = threading.Event()
+
+            def expire():
+                timed_out.set()
+                process.kill()
+
+            watchdog = threading.Timer(self.WINPMEM_TIMEOUT, expire)
+            watchdog.start()
+
+            crc = 0
+            written = 0
+            completed = False
+            try:
+                with HashingWriter(raw_out, self.image_algorithms) as out:
+                    buffer = memoryview(bytearray(self.STREAM_CHUNK_SIZE))
+                    while n := process.stdout.readinto(buffer):
+                        with buffer[:n] as chunk:
+                            out.write(chunk)
+                            crc = zlib.crc32(chunk, crc)
+                        written += n
+
+                    if timed_out.is_set():
+                        raise subprocess.TimeoutExpired(cmd, self.WINPMEM_TIMEOUT)
+
+                    # Drop whatever part of the reservation WinPmem did not fill.
+                    raw_out.truncate(written)
+
+                return_code = self._wait_for_winpmem(
+                    process, max(deadline - time.monotonic(), 0)
+                )
+                completed = True
+            finally:
+                watchdog.cancel()
+                if not completed:
+                    # Never leave a preallocated, zero-padded file posing as an image.
+                    process.kill()
+                    process.wait()
+                    raw_out.close()
+                    output_file.unlink(missing_ok=True)
+
+                # Join the drain before the with block closes the pipes under it.
+                stderr = _joined_output(*stderr_drain)
+                self.winpmem_output = stderr_drain[1]
+
+        if written == 0:
+            self.logger.warning(
+                f"WinPmem could not stream to stdout (return code {return_code}), "
+                "falling back to direct file output",
+                module="MemoryModule",
+            )
+            output_file.unlink(missing_ok=True)
+            return None
+
+        # A second acquisition would capture different RAM, so keep whatever
+        # was streamed; the return code goes into the acquisition metadata.
+        if return_code != 0:
+            self.logger.warning(
+                f"WinPmem exited with return code {return_code} after streaming "
+                f"{written} bytes; keeping the image",
+                module="MemoryModule",
+            )
+
+        self.image_hashes[output_file] = {**out.hexdigests(), "crc32": f"{crc:08x}"}
+        self.image_sizes[output_file] = written
+        return subprocess.CompletedProcess(cmd, return_code, stdout=stderr, stderr="")
+
+    def _expected_image_size(self) -> int:
+        import psutil
+
+        # Raw images pad holes in the physical address map, so they run a
+        # little larger than installed RAM.
+        return int(psutil.virtual_memory().total * 1.05)
+
+    def _preallocate(self, fd: int, size: int):
+        # Reserve the image's extents up front so the multi-GB write does not
+        # fragment and the hashing read-back stays sequential.
+        try:
+            if hasattr(os, "posix_fallocate"):
+                os.posix_fallocate(fd, 0, size)
             else:
-                cmd = [str(winpmem_path), str(output_file)]
+                os.ftruncate(fd, size)
+        except OSError as e:
+            self.logger.warning(f"Could not preallocate memory image: {e}", module="MemoryModule")
 
-            self.logger.info(
-                f"Starting memory acquisition with command: {' '.join(cmd)}", module="MemoryModule"
+    def _wait_for_winpmem(
+        self, process: subprocess.Popen, timeout: float = WINPMEM_TIMEOUT
+    ) -> int:
+        try:
+            return process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            raise
+
+    def _run_winpmem(self, cmd: list) -> subprocess.CompletedProcess:
+        # Only the tail of WinPmem's progress output is kept, so a chatty
+        # build cannot grow the captured text without bound.
+        with subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            creationflags=_WINPMEM_CREATION_FLAGS,
+        ) as process:
+            stdout_drain = _start_drain(process.stdout)
+            stderr_drain = _start_drain(process.stderr)
+            return_code = self._wait_for_winpmem(process)
+            self.winpmem_output = stdout_drain[1]
+
+            return subprocess.CompletedProcess(
+                cmd,
+                return_code,
+                stdout=_joined_output(*stdout_drain),
+                stderr=_joined_output(*stderr_drain),
             )
 
+    def _acquire_memory_with_winpmem(self, winpmem_path: Path, output_file: Path) -> bool:
+        try:
             start_time = time.time()
 
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=3600)
+            result = None
+            if self._winpmem_streams_to_stdout(winpmem_path):
+                result = self._stream_memory_with_winpmem(winpmem_path, output_file)
+
+            if result is None:
+                if self.winpmem_version == "3.0":
+                    cmd = [str(winpmem_path), str(output_file), "--format", "raw"]
+                else:
+                    cmd = [str(winpmem_path), str(output_file)]
+
+                self.logger.info(
+                    f"Starting memory acquisition with command: {' '.join(cmd)}",
+                    module="MemoryModule",
+                )
+
+                start_time = time.time()
+
+                result = self._run_winpmem(cmd)
+            else:
+                cmd = result.args
 
             elapsed_time = time.time() - start_time
 
@@ -136,7 +573,9 @@ class MemoryModule(ICollectionModule):
                 module="MemoryModule",
             )
 
-            if not output_file.exists():
+            try:
+                file_size_bytes = self._image_size(output_file)
+            except FileNotFoundError:
                 self.logger.error("Memory dump file was not created", module="MemoryModule")
                 self._create_winpmem_error_report(
                     winpmem_path,
@@ -148,7 +587,6 @@ class MemoryModule(ICollectionModule):
                 )
                 return False
 
-            file_size_bytes = output_file.stat().st_size
             file_size_gb = file_size_bytes / (1024**3)
             file_size_mb = file_size_bytes / (1024**2)
 
@@ -178,7 +616,7 @@ class MemoryModule(ICollectionModule):
             self.collected_files.append(output_file)
 
             self._create_acquisition_metadata(
-                output_file, elapsed_time, result.returncode, result.stdout
+                output_file, file_size_bytes, elapsed_time, result.returncode, self.winpmem_output
             )
 
             return True
@@ -194,29 +632,28 @@ class MemoryModule(ICollectionModule):
             return False
 
     def _create_acquisition_metadata(
-        self, memory_file: Path, elapsed_time: float, return_code: int, stdout: str
+        self,
+        memory_file: Path,
+        file_size: int,
+        elapsed_time: float,
+        return_code: int,
+        winpmem_output: Optional[_WinPmemOutput],
     ):
         try:
             metadata_file = self.output_dir / "acquisition_metadata.json"
 
-            import json
-            from datetime import datetime
-
-            memory_ranges = []
-            acquisition_method = "Unknown"
-
-            if stdout:
-                for line in stdout.split("\n"):
-                    if line.startswith("Start"):
-                        memory_ranges.append(line.strip())
-                    elif "Acquitision mode" in line or "Acquisition mode" in line:
-                        acquisition_method = line.split(":")[-1].strip()
+            if winpmem_output is not None:
+                memory_ranges = list(winpmem_output.memory_ranges)
+                acquisition_method = winpmem_output.acquisition_method
+            else:
+                memory_ranges = []
+                acquisition_method = "Unknown"
 
             metadata = {
                 "file": memory_file.name,
-                "file_size_bytes": memory_file.stat().st_size,
-                "file_size_gb": round(memory_file.stat().st_size / (1024**3), 2),
-                "acquisition_time": datetime.now().isoformat(),
+                "file_size_bytes": file_size,
+                "file_size_gb": round(file_size / (1024**3), 2),
+                "acquisition_time": self.run_time_iso,
                 "elapsed_time_seconds": round(elapsed_time, 1),
                 "tool": "WinPmem",
                 "tool_version": self.winpmem_version,
@@ -226,8 +663,11 @@ class MemoryModule(ICollectionModule):
                 "status": "completed",
             }
 
-            with open(metadata_file, "w", encoding="utf-8") as f:
-                json.dump(metadata, f, indent=4, ensure_ascii=False)
+            # Present when the image was hashed while being streamed to disk.
+            if memory_file in self.image_hashes:
+                metadata["hashes"] = self.image_hashes[memory_file]
+
+            write_json(metadata_file, metadata)
 
             self.collected_files.append(metadata_file)
 
@@ -248,35 +688,27 @@ class MemoryModule(ICollectionModule):
         try:
             error_file = self.output_dir / "winpmem_error_report.txt"
 
-            with open(error_file, "w", encoding="utf-8") as f:
-                f.write(
-                    """
+            parts = [
+                """
                         ╔═══════════════════════════════════════════════════════════════════════╗
                         ║           WinPmem Memory Acquisition Error Report                      ║
                         ╚═══════════════════════════════════════════════════════════════════════╝
 
-                        """
-                )
-                f.write(f"Error Reason: {error_reason}\n\n")
-
-                f.write("Command Executed:\n")
-                f.write("-" * 70 + "\n")
-                f.write(f"{' '.join(command)}\n\n")
-
-                f.write(f"Return Code: {return_code}\n\n")
-
-                f.write("Standard Output:\n")
-                f.write("-" * 70 + "\n")
-                f.write(stdout if stdout else "(empty)\n")
-                f.write("\n")
-
-                f.write("Standard Error:\n")
-                f.write("-" * 70 + "\n")
-                f.write(stderr if stderr else "(empty)\n")
-                f.write("\n")
-
-                f.write(
-                    """
+                        """,
+                f"Error Reason: {error_reason}\n\n",
+                "Command Executed:\n",
+                "-" * 70 + "\n",
+                f"{' '.join(command)}\n\n",
+                f"Return Code: {return_code}\n\n",
+                "Standard Output:\n",
+                "-" * 70 + "\n",
+                stdout if stdout else "(empty)\n",
+                "\n",
+                "Standard Error:\n",
+                "-" * 70 + "\n",
+                stderr if stderr else "(empty)\n",
+                "\n",
+                """
                         Troubleshooting:
                         ----------------
                         1. Check if you're running as Administrator
@@ -288,10 +720,11 @@ class MemoryModule(ICollectionModule):
                         Manual Acquisition:
                         -------------------
                         Try running WinPmem manually:
-                        """
-                )
-                f.write(f"cd {winpmem_path.parent}\n")
-                f.write(f"winpmem.exe manual_memory.raw\n")
+                        """,
+                f"cd {winpmem_path.parent}\n",
+                "winpmem.exe manual_memory.raw\n",
+            ]
+            error_file.write_text("".join(parts), encoding="utf-8")
 
             self.collected_files.append(error_file)
             self.logger.info(f"Created error report: {error_file}", module="MemoryModule")
@@ -300,10 +733,9 @@ class MemoryModule(ICollectionModule):
             self.logger.error(f"Failed to create error report: {e}", module="MemoryModule")
 
     def _acquire_memory(self) -> Optional[Path]:
-        from datetime import datetime
         import sys
 
-        output_file = self.output_dir / f"memory_{datetime.now().strftime('%Y%m%d_%H%M%S')}.raw"
+        output_file = self.output_dir / f"memory_{self.run_stamp}.raw"
 
         try:
             if getattr(sys, 'frozen', False):
@@ -319,18 +751,8 @@ class MemoryModule(ICollectionModule):
             )
 
             try:
-                version_result = subprocess.run(
-                    [str(winpmem_path), "--help"], capture_output=True, text=True, timeout=10
-                )
-
-                version_output = version_result.stdout + version_result.stderr
-
-                if "Version 3" in version_output or "v3." in version_output:
-                    self.winpmem_version = "3.0"
-                elif "Version 2" in version_output or "v2." in version_output:
-                    self.winpmem_version = "2.0"
-                else:
-                    self.winpmem_version = "2.0"
+                version_output = _winpmem_help(str(winpmem_path))
+                self.winpmem_version = "3.0" if _WINPMEM_V3_RE.search(version_output) else "2.0"
 
                 self.logger.info(
                     f"Detected WinPmem version: {self.winpmem_version}", module="MemoryModule"
@@ -357,11 +779,7 @@ class MemoryModule(ICollectionModule):
 
     def _detect_winpmem_version(self, winpmem_path: Path) -> dict:
         try:
-            result = subprocess.run(
-                [str(winpmem_path), "--help"], capture_output=True, text=True, timeout=10
-            )
-
-            output = result.stdout + result.stderr
+            output = _winpmem_help(str(winpmem_path))
 
             version = "unknown"
             if "v4" in output.lower() or "4.0" in output:
@@ -407,69 +825,24 @@ class MemoryModule(ICollectionModule):
     def _create_instruction_file(self, winpmem_path: Path, error: str = None):
         instruction_file = self.output_dir / "MEMORY_ACQUISITION_INSTRUCTIONS.txt"
 
-        with open(instruction_file, "w", encoding="utf-8") as f:
-            f.write(
-                f"""
-                    ╔═══════════════════════════════════════════════════════════════════════╗
-                    ║           Memory Acquisition Instructions                             ║
-                    ╚═══════════════════════════════════════════════════════════════════════╝
-
-                    {f"❌ Error: {error}" if error else "⚠️  WinPmem Not Found"}
-
-                    Expected Location:
-                    ------------------
-                    {winpmem_path}
-
-                    📥 How to Download WinPmem:
-                    ---------------------------
-                    1. Visit: https://github.com/Velocidex/WinPmem/releases
-                    2. Download the latest release (winpmem_mini_x64_*.exe)
-                    3. Rename to: winpmem.exe
-                    4. Place at: {winpmem_path.parent}
-
-                    Current directory listing:
-                    {'-' * 40}
-                    """
+        parts = [
+            _INSTRUCTIONS_HEADER_TEMPLATE.substitute(
+                status=f"❌ Error: {error}" if error else "⚠️  WinPmem Not Found",
+                winpmem_path=winpmem_path,
+                winpmem_dir=winpmem_path.parent,
             )
+        ]
 
-            tools_dir = winpmem_path.parent
-            if tools_dir.exists():
-                f.write(f"Contents of {tools_dir}:\n")
-                for item in tools_dir.iterdir():
-                    f.write(f"  - {item.name}\n")
-            else:
-                f.write(f"Directory does not exist: {tools_dir}\n")
-
-            f.write(
-                f"""
-
-                    💡 Manual Memory Acquisition:
-                    ------------------------------
-                    If you have WinPmem installed elsewhere, you can run it manually:
-
-                    1. Open Command Prompt as Administrator
-                    2. Navigate to WinPmem location
-                    3. Run: winpmem.exe memory.raw
-                    4. Place memory.raw in: {self.output_dir}
-
-                    📋 Alternative Tools:
-                    ---------------------
-                    1. DumpIt (Magnet Forensics)
-                    Download: https://www.magnetforensics.com/
-
-                    2. FTK Imager (AccessData)
-                    Download: https://www.exterro.com/
-
-                    3. Belkasoft RAM Capturer
-                    Download: https://belkasoft.com/ram-capturer
+        tools_dir = winpmem_path.parent
+        if tools_dir.exists():
+            parts.append(f"Contents of {tools_dir}:\n")
+            with os.scandir(tools_dir) as entries:
+                parts.extend(f"  - {entry.name}\n" for entry in entries)
+        else:
+            parts.append(f"Directory does not exist: {tools_dir}\n")
 
-                    For Volatility Analysis:
-                    ------------------------
-                    vol.py -f memory.raw windows.info
-                    vol.py -f memory.raw windows.pslist
-                    vol.py -f memory.raw windows.netscan
-                    """
-            )
+        parts.append(_INSTRUCTIONS_FOOTER_TEMPLATE.substitute(output_dir=self.output_dir))
+        instruction_file.write_text("".join(parts), encoding="utf-8")
 
         self.collected_files.append(instruction_file)
 
@@ -543,145 +916,193 @@ class MemoryModule(ICollectionModule):
         try:
             metadata_file = self.output_dir / "volatility_analysis_guide.txt"
 
-            os_version = system_info.get("os_version", "")
-            architecture = system_info.get("architecture", "")
-
-            if "Windows-10" in os_version:
-                if "AMD64" in architecture or "x86_64" in architecture:
-                    profile = "Win10x64"
-                else:
-                    profile = "Win10x86"
-            elif "Windows-11" in os_version:
-                profile = "Win10x64"
-            else:
-                profile = "WinXPSP2x86"
-
-            with open(metadata_file, "w") as f:
-                f.write(
-                    f"""
-Volatility Analysis Guide
-==========================
-
-Memory Image: {memory_file.name}
-Size: {memory_file.stat().st_size / (1024**3):.2f} GB
-Acquired: {system_info.get('acquisition_time', '')}
-
-System Information:
--------------------
-OS: {system_info.get('os', '')} {system_info.get('os_release', '')}
-Version: {system_info.get('os_version', '')}
-Architecture: {system_info.get('architecture', '')}
-Total Memory: {system_info.get('total_memory_gb', 0)} GB
-
-Volatility 2.x Commands:
-------------------------
-Profile: {profile}
-
-# List processes
-volatility -f {memory_file.name} --profile={profile} pslist
-
-# List network connections
-volatility -f {memory_file.name} --profile={profile} netscan
-
-# Dump process memory
-volatility -f {memory_file.name} --profile={profile} memdump -p PID -D output/
-
-# List DLLs
-volatility -f {memory_file.name} --profile={profile} dlllist
-
-# Find hidden processes
-volatility -f {memory_file.name} --profile={profile} psxview
-
-# Extract command history
-volatility -f {memory_file.name} --profile={profile} cmdscan
-volatility -f {memory_file.name} --profile={profile} consoles
-
-# Registry analysis
-volatility -f {memory_file.name} --profile={profile} hivelist
-volatility -f {memory_file.name} --profile={profile} printkey -K "SAM\\Domains\\Account\\Users"
-
-# Malware detection
-volatility -f {memory_file.name} --profile={profile} malfind
-volatility -f {memory_file.name} --profile={profile} apihooks
+            try:
+                size = self._image_size(memory_file)
+            except FileNotFoundError:
+                self.logger.warning(
+                    f"Memory image {memory_file.name} is missing; skipping Volatility guide",
+                    module="MemoryModule",
+                )
+                return
 
+            profile = _volatility_profile(
+                system_info.get("os_version", ""), system_info.get("architecture", "")
+            )
 
-Volatility 3.x Commands:
-------------------------
-# List processes
-vol.py -f {memory_file.name} windows.pslist
+            metadata_file.write_text(
+                _VOLATILITY_GUIDE_TEMPLATE.substitute(
+                    memory_file=memory_file.name,
+                    size_gb=f"{size / (1024**3):.2f}",
+                    acquisition_time=system_info.get("acquisition_time", ""),
+                    os=system_info.get("os", ""),
+                    os_release=system_info.get("os_release", ""),
+                    os_version=system_info.get("os_version", ""),
+                    architecture=system_info.get("architecture", ""),
+                    total_memory_gb=system_info.get("total_memory_gb", 0),
+                    profile=profile,
+                )
+            )
 
-# List network connections
-vol.py -f {memory_file.name} windows.netscan
+            self.collected_files.append(metadata_file)
 
-# Dump process
-vol.py -f {memory_file.name} windows.memmap --pid PID --dump
+        except Exception as e:
+            self.logger.error(f"Failed to generate Volatility metadata: {e}", module="MemoryModule")
 
-# List DLLs
-vol.py -f {memory_file.name} windows.dlllist
+    def _image_size(self, file_path: Path) -> int:
+        size = self.image_sizes.get(file_path)
+        if size is None:
+            size = self.image_sizes[file_path] = os.stat(file_path).st_size
+        return size
 
-# Command history
-vol.py -f {memory_file.name} windows.cmdline
+    def _calculate_hashes(self):
+        hash_file = self.output_dir / "hashes.txt"
+        sizes = {}
+        for file_path in self.collected_files:
+            if file_path.name.rpartition(".")[2] not in self.IMAGE_EXTENSIONS:
+                continue
 
-# Registry
-vol.py -f {memory_file.name} windows.registry.hivelist
-vol.py -f {memory_file.name} windows.registry.printkey
+            try:
+                st = os.stat(file_path)
+            except FileNotFoundError:
+                continue
 
-# Malware detection
-vol.py -f {memory_file.name} windows.malfind
+            sizes[file_path] = self.image_sizes[file_path] = st.st_size
 
+        images = list(sizes)
+        results_by_file = {}
+        for file_path in images:
+            hashes = self.image_hashes.get(file_path)
+            if hashes and all(alg in hashes for alg in self.image_algorithms):
+                results_by_file[file_path] = hashes
+        pending = [file_path for file_path in images if file_path not in results_by_file]
 
-Recommended Analysis Workflow:
--------------------------------
-1. Identify running processes (pslist)
-2. Check network connections (netscan)
-3. Look for hidden/suspicious processes (psxview, malfind)
-4. Extract command history (cmdscan, consoles)
-5. Analyze registry for persistence (printkey)
-6. Dump suspicious process memory for further analysis
-
-For more information:
-- Volatility 2: https://github.com/volatilityfoundation/volatility
-- Volatility 3: https://github.com/volatilityfoundation/volatility3
-- Volatility Cheat Sheet: https://downloads.volatilityfoundation.org/releases/2.4/CheatSheet_v2.4.pdf
+        for file_path in pending:
+            self.logger.info(
+                f"Calculating hash for {file_path.name} (this may take a while)...",
+                module="MemoryModule",
+            )
 
-"""
+        hashed = self.hash_calculator.calculate_hashes_for_files(pending, self.image_algorithms)
+        results_by_file.update(hashed)
+        self.image_hashes.update(hashed)
+
+        lines = ["Memory Image Hashes\n", "=" * 80 + "\n\n"]
+        for file_path in images:
+            size = sizes[file_path]
+            hashes = results_by_file[file_path]
+
+            lines.append(f"File: {file_path.name}\n")
+            lines.append(f"Size: {size / (1024**3):.2f} GB\n")
+            lines.extend(f"{algo.upper()}: {hash_value}\n" for algo, hash_value in hashes.items())
+            if self.tree_hash:
+                lines.append(
+                    f"SHA256-TREE ({self.TREE_HASH_SEGMENT_SIZE // (1024**2)} MiB segments): "
+                    f"{self._calculate_tree_hash(file_path, size)}\n"
                 )
+            lines.append("\n")
 
-            self.collected_files.append(metadata_file)
+            self.logger.log_collection(
+                module="MemoryModule",
+                action="Memory image collected",
+                status="Success",
+                file_path=str(file_path),
+                file_size=size,
+                hash_sha256=hashes.get("sha256", ""),
+            )
 
+        # Write the manifest durably before it replaces the previous one, so a
+        # crash mid-run never leaves a truncated hashes.txt behind.
+        tmp_file = hash_file.with_name(hash_file.name + ".tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            f.write("".join(lines))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, hash_file)
+
+    def _calculate_tree_hash(self, file_path: Path, file_size: int) -> str:
+        # SHA-256 over the concatenated SHA-256 digests of fixed-size segments.
+        # hashlib releases the GIL per segment, so threads scale across cores.
+        import mmap
+        from concurrent.futures import ThreadPoolExecutor
+
+        segment_size = self.TREE_HASH_SEGMENT_SIZE
+        if file_size == 0:
+            return hashlib.sha256().hexdigest()
+
+        with open(file_path, "rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mapped, memoryview(mapped) as view:
+
+            def segment_digest(offset: int) -> bytes:
+                with view[offset:offset + segment_size] as segment:
+                    return hashlib.sha256(segment).digest()
+
+            with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as executor:
+                digests = list(executor.map(segment_digest, range(0, len(view), segment_size)))
+
+        return hashlib.sha256(b"".join(digests)).hexdigest()
+
+    def _copy_to_evidence_storage(self, memory_file: Path):
+        # The image is already acquired and hashed; a failed copy is reported
+        # but does not fail the module.
+        self.logger.info("Copying memory image to evidence storage...", module="MemoryModule")
+        evidence_file = Path(self.evidence_copy_dir) / memory_file.name
+        try:
+            evidence_file.parent.mkdir(parents=True, exist_ok=True)
+            self._evidence_copy(memory_file, evidence_file)
+
+            expected = self.image_hashes.get(memory_file, {}).get("sha256")
+            actual = self.hash_calculator.calculate_file_hashes(evidence_file, ["sha256"])
+            if not expected or actual.get("sha256") != expected:
+                evidence_file.unlink(missing_ok=True)
+                raise OSError(
+                    f"SHA-256 of the copy ({actual.get('sha256') or 'unavailable'}) does not "
+                    f"match the recorded image hash ({expected or 'unavailable'})"
+                )
         except Exception as e:
-            self.logger.error(f"Failed to generate Volatility metadata: {e}", module="MemoryModule")
-
-    def _calculate_hashes(self):
-        hash_file = self.output_dir / "hashes.txt"
-
-        with open(hash_file, "w", encoding="utf-8") as f:
-            f.write("Memory Image Hashes\n")
-            f.write("=" * 80 + "\n\n")
-
-            for file_path in self.collected_files:
-                if file_path.exists() and file_path.suffix in [".raw", ".dmp"]:
-                    self.logger.info(
-                        f"Calculating hash for {file_path.name} (this may take a while)...",
-                        module="MemoryModule",
-                    )
-
-                    hashes = self.hash_calculator.calculate_file_hashes(file_path, ["sha256"])
-
-                    f.write(f"File: {file_path.name}\n")
-                    f.write(f"Size: {file_path.stat().st_size / (1024**3):.2f} GB\n")
-                    for algo, hash_value in hashes.items():
-                        f.write(f"{algo.upper()}: {hash_value}\n")
-                    f.write("\n")
-
-                    self.logger.log_collection(
-                        module="MemoryModule",
-                        action="Memory image collected",
-                        status="Success",
-                        file_path=str(file_path),
-                        file_size=file_path.stat().st_size,
-                        hash_sha256=hashes.get("sha256", ""),
-                    )
+            self.logger.warning(
+                f"Evidence copy to {evidence_file} failed: {e}", module="MemoryModule"
+            )
+            return
+
+        self.logger.info(
+            f"Evidence copy written and verified: {evidence_file}", module="MemoryModule"
+        )
+
+    def _evidence_copy(self, src: Path, dst: Path):
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            size = os.fstat(fsrc.fileno()).st_size
+            if hasattr(os, "copy_file_range"):
+                # Kernel-side copy; no data passes through userspace buffers.
+                remaining = size
+                try:
+                    while remaining > 0:
+                        copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                        if copied == 0:
+                            break
+                        remaining -= copied
+                except OSError:
+                    # Unsupported by this kernel or filesystem pair; restart
+                    # with a plain buffered copy.
+                    fsrc.seek(0)
+                    fdst.seek(0)
+                    fdst.truncate()
+                else:
+                    if remaining:
+                        raise OSError(
+                            f"Short copy of {src.name}: {size - remaining} of {size} bytes"
+                        )
+                    return
+
+            copied = 0
+            buffer = memoryview(bytearray(self.STREAM_CHUNK_SIZE))
+            while n := fsrc.readinto(buffer):
+                with buffer[:n] as chunk:
+                    fdst.write(chunk)
+                copied += n
+
+            if copied != size:
+                raise OSError(f"Short copy of {src.name}: {copied} of {size} bytes")
 
     def cleanup(self) -> None:
         self.logger.debug("Memory module cleanup", module="MemoryModule")
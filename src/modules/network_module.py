@@ -1,23 +1,228 @@
 import psutil
+import shutil
 import subprocess
 from pathlib import Path
-from typing import Dict, Any, Optional
-import json
+from typing import Dict, Any, List
+import os
 import threading
 import time
+from functools import lru_cache
+from socket import SOCK_DGRAM, SOCK_STREAM
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from src.modules.base_module import ICollectionModule, ModuleStatus
 from src.services.logger import get_logger
 from src.services.hash_calculator import HashCalculator
+from src.utils.console import console_to_utf8
+from src.utils.json_writer import dumps_compact
+
+# Written ahead of the command's own output, which uses the console's
+# native line endings.
+_ARP_HEADER = (
+    "ARP Cache Analysis\n"
+    + "=" * 80 + "\n\n"
+    + "Purpose: Map IP addresses to MAC addresses\n"
+    + "Forensic Value: Recent network communications\n\n"
+).replace("\n", os.linesep).encode('utf-8')
+
+_ROUTE_HEADER = (
+    "Routing Table Analysis\n"
+    + "=" * 80 + "\n\n"
+    + "Purpose: Network path information\n"
+    + "Forensic Value: Network configuration, VPN detection\n\n"
+).replace("\n", os.linesep).encode('utf-8')
+
+_DNS_HEADER = (
+    "DNS Cache Analysis\n"
+    + "=" * 80 + "\n\n"
+    + "Purpose: Recent DNS queries\n"
+    + "Forensic Value: Websites visited, C2 domains, malicious sites\n\n"
+).replace("\n", os.linesep).encode('utf-8')
+
+# Static guides, encoded once with the platform line ending so the files
+# match what a text-mode write would have produced.
+_PACKET_CAPTURE_TOOLS_GUIDE = """
+╔═══════════════════════════════════════════════════════════════════════╗
+║           Packet Capture Tools Not Found                              ║
+╚═══════════════════════════════════════════════════════════════════════╝
+
+To enable network traffic capture in PCAP format, you need to install
+packet capture tools.
+
+📥 Recommended: Wireshark (includes tshark and dumpcap)
+----------------------------------------------------------------
+Download: https://www.wireshark.org/download.html
+
+Installation:
+1. Download Wireshark installer
+2. During installation, select:
+✓ Wireshark
+✓ TShark (command-line)
+✓ Npcap (packet capture driver)
+3. Complete installation
+4. Restart WinScope
+
+After installation, tshark will be available in PATH.
+
+📋 Manual Packet Capture (Alternative):
+----------------------------------------
+If you want to capture packets manually:
+
+1. Using Wireshark GUI:
+- Open Wireshark
+- Select network interface
+- Click "Start Capture"
+- Save as: network_traffic.pcapng
+
+2. Using tshark:
+tshark -i <interface> -w network_traffic.pcap -a duration:60
+
+3. Using tcpdump (if available):
+tcpdump -i <interface> -w network_traffic.pcap
+
+Place the resulting .pcap/.pcapng file in this directory for analysis.
+
+🔍 Analyzing PCAP Files:
+-------------------------
+Wireshark: wireshark network_traffic.pcap
+Tshark: tshark -r network_traffic.pcap
+""".replace("\n", os.linesep).encode('utf-8')
+
+_WIRESHARK_GUIDE = """
+╔═══════════════════════════════════════════════════════════════════════╗
+║              Wireshark Network Analysis Guide                         ║
+╚═══════════════════════════════════════════════════════════════════════╝
+
+📊 Opening PCAP Files:
+----------------------
+Wireshark:  wireshark network_traffic.pcapng
+Tshark:     tshark -r network_traffic.pcapng
+
+🔍 Common Display Filters:
+---------------------------
+# HTTP Traffic
+http
+
+# HTTPS/TLS
+tls or ssl
+
+# DNS Queries
+dns
+
+# Specific IP
+ip.addr == 192.168.1.100
+
+# Specific Port
+tcp.port == 80 or udp.port == 53
+
+# SYN Scans (Port Scanning)
+tcp.flags.syn == 1 and tcp.flags.ack == 0
+
+# Failed Connections
+tcp.flags.reset == 1
+
+# Large Packets (>1000 bytes)
+frame.len > 1000
+
+# Suspicious Protocols
+ftp or telnet or smtp
+
+📋 Forensic Analysis Checklist:
+--------------------------------
+1. Identify Communication Patterns
+- Statistics > Conversations
+- Statistics > Endpoints
+
+2. Extract HTTP Objects
+- File > Export Objects > HTTP
+
+3. Follow TCP Streams
+- Right-click packet > Follow > TCP Stream
+
+4. DNS Analysis
+- dns and (dns.flags.response == 0)  # Queries
+- dns.qry.name contains "suspicious"
+
+5. Detect Port Scans
+- tcp.flags.syn == 1 and tcp.flags.ack == 0
+- tcp.analysis.flags
+
+6. Find Data Exfiltration
+- Large uploads: tcp.len > 1000 and ip.src == [internal_ip]
+- FTP file transfers: ftp-data
+- HTTP POST: http.request.method == "POST"
+
+7. Identify Malware C2
+- Beaconing: regular intervals in conversations
+- Non-standard ports: tcp.port != 80 and tcp.port != 443
+
+🛠️ Tshark Commands:
+--------------------
+# Extract HTTP requests
+tshark -r network_traffic.pcapng -Y "http.request" -T fields -e http.request.method -e http.host -e http.request.uri
+
+# Count packets by protocol
+tshark -r network_traffic.pcapng -q -z io,phs
+
+# Extract DNS queries
+tshark -r network_traffic.pcapng -Y "dns.flags.response == 0" -T fields -e dns.qry.name
+
+# Statistics summary
+tshark -r network_traffic.pcapng -q -z conv,tcp
+
+# Export HTTP objects
+tshark -r network_traffic.pcapng --export-objects http,./http_objects/
+
+🔗 Integration with Other Tools:
+---------------------------------
+NetworkMiner: NetworkMiner.exe network_traffic.pcapng
+- Extract files, credentials, hostnames
+
+Zeek (Bro): zeek -r network_traffic.pcapng
+- Generate detailed logs
+
+Snort: snort -r network_traffic.pcapng -c snort.conf
+- IDS analysis
+
+📚 Resources:
+-------------
+- Wireshark User Guide: https://www.wireshark.org/docs/wsug_html/
+- Display Filter Reference: https://www.wireshark.org/docs/dfref/
+- Wireshark Tutorial: https://www.wireshark.org/docs/
+
+⚠️  Analysis Tips:
+------------------
+- Look for anomalies in normal traffic patterns
+- Check for connections to suspicious IPs/domains
+- Analyze timing patterns for beaconing
+- Extract and analyze transferred files
+- Correlate with other evidence (process list, timestamps)
+""".replace("\n", os.linesep).encode('utf-8')
+
+_CAPTURE_TOOLS = ('tshark', 'dumpcap', 'windump')
+
+
+@lru_cache(maxsize=None)
+def _tool_available(tool: str) -> bool:
+    # A PATH lookup is enough to tell whether the tool is installed; no need
+    # to launch it. Cached so later NetworkModule instances skip the scan.
+    return shutil.which(tool) is not None
 
 
 class NetworkModule(ICollectionModule):
+    # Keyed like the connections.json records so one dict feeds both outputs.
+    _TCP_ROW = (
+        '{local_addr:<30} {remote_addr:<30} {status:<15} {pid!s:<10} {process:<20}\n'.format_map
+    )
+    _UDP_ROW = '{local_addr:<30} {pid!s:<10} {process:<20}\n'.format_map
+
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         self.logger = get_logger()
         self.hash_calculator = HashCalculator()
         self.output_dir = Path(config.get("output_dir", "network"))
         self.collected_files = []
+        self.file_hashes = {}
 
         self.capture_traffic = config.get("capture_traffic", False)
         self.capture_duration = config.get("capture_duration", 60)
@@ -69,31 +274,31 @@ class NetworkModule(ICollectionModule):
                 self._start_packet_capture()
                 self.progress = 5
 
-            self.logger.info("Collecting network connections...", module="NetworkModule")
-            self._collect_connections()
-            self.progress = 20
-
-            self.logger.info("Collecting ARP cache...", module="NetworkModule")
-            self._collect_arp_cache()
-            self.progress = 35
+            collectors = [
+                ("Collecting network connections...", self._collect_connections),
+                ("Collecting ARP cache...", self._collect_arp_cache),
+                ("Collecting routing table...", self._collect_routing_table),
+                ("Collecting DNS cache...", self._collect_dns_cache),
+                ("Collecting network interfaces...", self._collect_interfaces),
+                ("Generating analysis guide...", self._generate_wireshark_guide),
+            ]
 
-            self.logger.info("Collecting routing table...", module="NetworkModule")
-            self._collect_routing_table()
-            self.progress = 50
+            with ThreadPoolExecutor(max_workers=len(collectors)) as executor:
+                futures = []
+                for message, collector in collectors:
+                    self.logger.info(message, module="NetworkModule")
+                    futures.append(executor.submit(collector))
 
-            self.logger.info("Collecting DNS cache...", module="NetworkModule")
-            self._collect_dns_cache()
-            self.progress = 65
+                for done, _ in enumerate(as_completed(futures), 1):
+                    self.progress = 5 + int(done / len(collectors) * 75)
 
-            self.logger.info("Collecting network interfaces...", module="NetworkModule")
-            self._collect_interfaces()
-            self.progress = 75
-
-            self.logger.info("Generating analysis guide...", module="NetworkModule")
-            self._generate_wireshark_guide()
-            self.progress = 80
+            for future in futures:
+                self.collected_files.extend(future.result())
 
             if self.capture_traffic and self.capture_thread:
+                # Hash the finished reports while tshark is still capturing.
+                self._hash_files(list(self.collected_files))
+
                 self.logger.info("Waiting for packet capture to complete...", module="NetworkModule")
                 self.capture_thread.join(timeout=self.capture_duration + 10)
                 self.progress = 90
@@ -120,72 +325,16 @@ class NetworkModule(ICollectionModule):
             return False
 
     def _check_capture_tools(self) -> bool:
-        tools = ['tshark', 'dumpcap', 'windump']
-
-        for tool in tools:
-            try:
-                result = subprocess.run(
-                    [tool, '--version'],
-                    capture_output=True,
-                    timeout=5
+        for tool in _CAPTURE_TOOLS:
+            if _tool_available(tool):
+                self.logger.info(
+                    f"Found packet capture tool: {tool}",
+                    module="NetworkModule"
                 )
-                if result.returncode == 0:
-                    self.logger.info(
-                        f"Found packet capture tool: {tool}",
-                        module="NetworkModule"
-                    )
-                    return True
-            except (FileNotFoundError, subprocess.TimeoutExpired):
-                continue
+                return True
 
         instruction_file = self.output_dir / "PACKET_CAPTURE_TOOLS.txt"
-        with open(instruction_file, 'w', encoding='utf-8') as f:
-            f.write("""
-╔═══════════════════════════════════════════════════════════════════════╗
-║           Packet Capture Tools Not Found                              ║
-╚═══════════════════════════════════════════════════════════════════════╝
-
-To enable network traffic capture in PCAP format, you need to install
-packet capture tools.
-
-📥 Recommended: Wireshark (includes tshark and dumpcap)
-----------------------------------------------------------------
-Download: https://www.wireshark.org/download.html
-
-Installation:
-1. Download Wireshark installer
-2. During installation, select:
-✓ Wireshark
-✓ TShark (command-line)
-✓ Npcap (packet capture driver)
-3. Complete installation
-4. Restart WinScope
-
-After installation, tshark will be available in PATH.
-
-📋 Manual Packet Capture (Alternative):
-----------------------------------------
-If you want to capture packets manually:
-
-1. Using Wireshark GUI:
-- Open Wireshark
-- Select network interface
-- Click "Start Capture"
-- Save as: network_traffic.pcapng
-
-2. Using tshark:
-tshark -i <interface> -w network_traffic.pcap -a duration:60
-
-3. Using tcpdump (if available):
-tcpdump -i <interface> -w network_traffic.pcap
-
-Place the resulting .pcap/.pcapng file in this directory for analysis.
-
-🔍 Analyzing PCAP Files:
--------------------------
-Wireshark: wireshark network_traffic.pcap
-Tshark: tshark -r network_traffic.pcap
-""")
+        instruction_file.write_bytes(_PACKET_CAPTURE_TOOLS_GUIDE)
 
         self.collected_files.append(instruction_file)
         return False
@@ -244,7 +393,9 @@ Tshark: tshark -r network_traffic.pcap
         self.capture_thread = threading.Thread(target=capture_packets, daemon=True)
         self.capture_thread.start()
 
-    def _collect_connections(self):
+    def _collect_connections(self) -> List[Path]:
+        collected = []
+
         try:
             txt_file = self.output_dir / "connections.txt"
 
@@ -253,80 +404,77 @@ Tshark: tshark -r network_traffic.pcap
             connections_data = []
 
             with open(txt_file, 'w', encoding='utf-8') as f:
-                f.write("Network Connections Analysis\n")
-                f.write("=" * 100 + "\n\n")
-                f.write("Compatible with: Wireshark, NetworkMiner, Volatility\n\n")
+                lines = [
+                    "Network Connections Analysis\n",
+                    "=" * 100 + "\n\n",
+                    "Compatible with: Wireshark, NetworkMiner, Volatility\n\n",
+                ]
 
                 connections = psutil.net_connections(kind='inet')
 
-                f.write(f"Total Connections: {len(connections)}\n\n")
+                tcp_connections = []
+                udp_connections = []
+                for conn in connections:
+                    if conn.type == SOCK_STREAM:
+                        tcp_connections.append(conn)
+                    elif conn.type == SOCK_DGRAM:
+                        udp_connections.append(conn)
+
+                process_names = self._process_names()
+
+                lines += [
+                    f"Total Connections: {len(connections)}\n\n",
+                    "TCP Connections:\n",
+                    "-" * 100 + "\n",
+                    f"{'Local Address':<30} {'Remote Address':<30} {'Status':<15} "
+                    f"{'PID':<10} {'Process':<20}\n",
+                    "-" * 100 + "\n",
+                ]
 
-                f.write("TCP Connections:\n")
-                f.write("-" * 100 + "\n")
-                f.write(f"{'Local Address':<30} {'Remote Address':<30} {'Status':<15} {'PID':<10} {'Process':<20}\n")
-                f.write("-" * 100 + "\n")
+                tcp_row = self._TCP_ROW
+                for conn in tcp_connections:
+                    record = {
+                        'type': 'TCP',
+                        'local_addr': f"{conn.laddr.ip}:{conn.laddr.port}" if conn.laddr else "N/A",
+                        'remote_addr': (
+                            f"{conn.raddr.ip}:{conn.raddr.port}" if conn.raddr else "N/A"
+                        ),
+                        'status': conn.status,
+                        'pid': conn.pid if conn.pid else "N/A",
+                        'process': process_names.get(conn.pid, "N/A")
+                    }
+                    lines.append(tcp_row(record))
+                    connections_data.append(record)
 
-                for conn in connections:
-                    if conn.type == 1:
-                        local = f"{conn.laddr.ip}:{conn.laddr.port}" if conn.laddr else "N/A"
-                        remote = f"{conn.raddr.ip}:{conn.raddr.port}" if conn.raddr else "N/A"
-                        status = conn.status
-                        pid = conn.pid if conn.pid else "N/A"
-
-                        process_name = "N/A"
-                        if conn.pid:
-                            try:
-                                process = psutil.Process(conn.pid)
-                                process_name = process.name()
-                            except:
-                                pass
-
-                        f.write(f"{local:<30} {remote:<30} {status:<15} {str(pid):<10} {process_name:<20}\n")
-
-                        connections_data.append({
-                            'type': 'TCP',
-                            'local_addr': local,
-                            'remote_addr': remote,
-                            'status': status,
-                            'pid': pid,
-                            'process': process_name
-                        })
-
-                f.write("\n\nUDP Connections:\n")
-                f.write("-" * 100 + "\n")
-                f.write(f"{'Local Address':<30} {'PID':<10} {'Process':<20}\n")
-                f.write("-" * 100 + "\n")
+                f.write(''.join(lines))
 
-                for conn in connections:
-                    if conn.type == 2:
-                        local = f"{conn.laddr.ip}:{conn.laddr.port}" if conn.laddr else "N/A"
-                        pid = conn.pid if conn.pid else "N/A"
-
-                        process_name = "N/A"
-                        if conn.pid:
-                            try:
-                                process = psutil.Process(conn.pid)
-                                process_name = process.name()
-                            except:
-                                pass
-
-                        f.write(f"{local:<30} {str(pid):<10} {process_name:<20}\n")
-
-                        connections_data.append({
-                            'type': 'UDP',
-                            'local_addr': local,
-                            'pid': pid,
-                            'process': process_name
-                        })
-
-            with open(json_file, 'w', encoding='utf-8') as f:
-                json.dump({
-                    'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
-                    'total_connections': len(connections),
-                    'connections': connections_data
-                }, f, indent=4, ensure_ascii=False)
-
-            self.collected_files.extend([txt_file, json_file])
+                lines = [
+                    "\n\nUDP Connections:\n",
+                    "-" * 100 + "\n",
+                    f"{'Local Address':<30} {'PID':<10} {'Process':<20}\n",
+                    "-" * 100 + "\n",
+                ]
+
+                udp_row = self._UDP_ROW
+                for conn in udp_connections:
+                    record = {
+                        'type': 'UDP',
+                        'local_addr': f"{conn.laddr.ip}:{conn.laddr.port}" if conn.laddr else "N/A",
+                        'pid': conn.pid if conn.pid else "N/A",
+                        'process': process_names.get(conn.pid, "N/A")
+                    }
+                    lines.append(udp_row(record))
+                    connections_data.append(record)
+
+                f.write(''.join(lines))
+
+            json_file.write_bytes(dumps_compact({
+                'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
+                'total_connections': len(connections),
+                'connections': connections_data
+            }))
+
+            collected.extend([txt_file, json_file])
             self.logger.info(
                 f"Collected {len(connections)} network connections",
                 module="NetworkModule"
@@ -335,83 +483,76 @@ Tshark: tshark -r network_traffic.pcap
         except Exception as e:
             self.logger.error(f"Failed to collect connections: {e}", module="NetworkModule")
 
-    def _collect_arp_cache(self):
+        return collected
+
+    def _process_names(self) -> Dict[int, str]:
+        """Map every visible pid to its process name in one process walk."""
+        return {
+            proc.pid: proc.info['name']
+            for proc in psutil.process_iter(['name'])
+            if proc.pid and proc.info['name']
+        }
+
+    def _collect_arp_cache(self) -> List[Path]:
+        collected = []
+
         try:
             output_file = self.output_dir / "arp_cache.txt"
 
-            result = subprocess.run(
-                ['arp', '-a'],
-                capture_output=True,
-                text=True,
-                encoding='cp437'
-            )
-
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write("ARP Cache Analysis\n")
-                f.write("=" * 80 + "\n\n")
-                f.write("Purpose: Map IP addresses to MAC addresses\n")
-                f.write("Forensic Value: Recent network communications\n\n")
-                f.write(result.stdout)
+            self._write_command_output(output_file, ['arp', '-a'], _ARP_HEADER)
 
-            self.collected_files.append(output_file)
+            collected.append(output_file)
             self.logger.info(f"ARP cache saved", module="NetworkModule")
 
         except Exception as e:
             self.logger.error(f"Failed to collect ARP cache: {e}", module="NetworkModule")
 
-    def _collect_routing_table(self):
+        return collected
+
+    def _collect_routing_table(self) -> List[Path]:
+        collected = []
+
         try:
             output_file = self.output_dir / "routing_table.txt"
 
-            result = subprocess.run(
-                ['route', 'print'],
-                capture_output=True,
-                text=True,
-                encoding='cp437'
-            )
-
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write("Routing Table Analysis\n")
-                f.write("=" * 80 + "\n\n")
-                f.write("Purpose: Network path information\n")
-                f.write("Forensic Value: Network configuration, VPN detection\n\n")
-                f.write(result.stdout)
+            self._write_command_output(output_file, ['route', 'print'], _ROUTE_HEADER)
 
-            self.collected_files.append(output_file)
+            collected.append(output_file)
             self.logger.info(f"Routing table saved", module="NetworkModule")
 
         except Exception as e:
             self.logger.error(f"Failed to collect routing table: {e}", module="NetworkModule")
 
-    def _collect_dns_cache(self):
+        return collected
+
+    def _collect_dns_cache(self) -> List[Path]:
+        collected = []
+
         try:
             output_file = self.output_dir / "dns_cache.txt"
 
-            result = subprocess.run(
-                ['ipconfig', '/displaydns'],
-                capture_output=True,
-                text=True,
-                encoding='cp437'
-            )
-
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write("DNS Cache Analysis\n")
-                f.write("=" * 80 + "\n\n")
-                f.write("Purpose: Recent DNS queries\n")
-                f.write("Forensic Value: Websites visited, C2 domains, malicious sites\n\n")
-                f.write(result.stdout)
+            self._write_command_output(output_file, ['ipconfig', '/displaydns'], _DNS_HEADER)
 
-            self.collected_files.append(output_file)
+            collected.append(output_file)
             self.logger.info(f"DNS cache saved", module="NetworkModule")
 
         except Exception as e:
             self.logger.error(f"Failed to collect DNS cache: {e}", module="NetworkModule")
 
-    def _collect_interfaces(self):
+        return collected
+
+    def _write_command_output(self, output_file: Path, cmd: list, header: bytes):
+        result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        output_file.write_bytes(header + console_to_utf8(result.stdout))
+
+    def _collect_interfaces(self) -> List[Path]:
+        collected = []
+
         try:
             output_file = self.output_dir / "interfaces.json"
 
             interfaces = {}
+            stats_by_interface = psutil.net_if_stats()
 
             for interface_name, addresses in psutil.net_if_addrs().items():
                 interface_info = {
@@ -420,152 +561,42 @@ Tshark: tshark -r network_traffic.pcap
 
                 for addr in addresses:
                     addr_info = {
-                        "family": str(addr.family),
+                        "family": int(addr.family),
                         "address": addr.address,
                         "netmask": addr.netmask,
                         "broadcast": addr.broadcast
                     }
                     interface_info["addresses"].append(addr_info)
 
-                try:
-                    stats = psutil.net_if_stats()[interface_name]
+                stats = stats_by_interface.get(interface_name)
+                if stats is not None:
                     interface_info["stats"] = {
                         "isup": stats.isup,
-                        "duplex": str(stats.duplex),
+                        "duplex": int(stats.duplex),
                         "speed": stats.speed,
                         "mtu": stats.mtu
                     }
-                except:
-                    pass
 
                 interfaces[interface_name] = interface_info
 
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(interfaces, f, indent=4, ensure_ascii=False)
+            output_file.write_bytes(dumps_compact(interfaces))
 
-            self.collected_files.append(output_file)
+            collected.append(output_file)
             self.logger.info(f"Network interfaces saved", module="NetworkModule")
 
         except Exception as e:
             self.logger.error(f"Failed to collect interfaces: {e}", module="NetworkModule")
 
-    def _generate_wireshark_guide(self):
-        try:
-            guide_file = self.output_dir / "wireshark_analysis_guide.txt"
-
-            with open(guide_file, 'w', encoding='utf-8') as f:
-                f.write("""
-╔═══════════════════════════════════════════════════════════════════════╗
-║              Wireshark Network Analysis Guide                         ║
-╚═══════════════════════════════════════════════════════════════════════╝
-
-📊 Opening PCAP Files:
-----------------------
-Wireshark:  wireshark network_traffic.pcapng
-Tshark:     tshark -r network_traffic.pcapng
-
-🔍 Common Display Filters:
----------------------------
-# HTTP Traffic
-http
-
-# HTTPS/TLS
-tls or ssl
-
-# DNS Queries
-dns
-
-# Specific IP
-ip.addr == 192.168.1.100
-
-# Specific Port
-tcp.port == 80 or udp.port == 53
-
-# SYN Scans (Port Scanning)
-tcp.flags.syn == 1 and tcp.flags.ack == 0
-
-# Failed Connections
-tcp.flags.reset == 1
-
-# Large Packets (>1000 bytes)
-frame.len > 1000
-
-# Suspicious Protocols
-ftp or telnet or smtp
-
-📋 Forensic Analysis Checklist:
---------------------------------
-1. Identify Communication Patterns
-- Statistics > Conversations
-- Statistics > Endpoints
-
-2. Extract HTTP Objects
-- File > Export Objects > HTTP
-
-3. Follow TCP Streams
-- Right-click packet > Follow > TCP Stream
-
-4. DNS Analysis
-- dns and (dns.flags.response == 0)  # Queries
-- dns.qry.name contains "suspicious"
+        return collected
 
-5. Detect Port Scans
-- tcp.flags.syn == 1 and tcp.flags.ack == 0
-- tcp.analysis.flags
+    def _generate_wireshark_guide(self) -> List[Path]:
+        collected = []
 
-6. Find Data Exfiltration
-- Large uploads: tcp.len > 1000 and ip.src == [internal_ip]
-- FTP file transfers: ftp-data
-- HTTP POST: http.request.method == "POST"
-
-7. Identify Malware C2
-- Beaconing: regular intervals in conversations
-- Non-standard ports: tcp.port != 80 and tcp.port != 443
-
-🛠️ Tshark Commands:
---------------------
-# Extract HTTP requests
-tshark -r network_traffic.pcapng -Y "http.request" -T fields -e http.request.method -e http.host -e http.request.uri
-
-# Count packets by protocol
-tshark -r network_traffic.pcapng -q -z io,phs
-
-# Extract DNS queries
-tshark -r network_traffic.pcapng -Y "dns.flags.response == 0" -T fields -e dns.qry.name
-
-# Statistics summary
-tshark -r network_traffic.pcapng -q -z conv,tcp
-
-# Export HTTP objects
-tshark -r network_traffic.pcapng --export-objects http,./http_objects/
-
-🔗 Integration with Other Tools:
----------------------------------
-NetworkMiner: NetworkMiner.exe network_traffic.pcapng
-- Extract files, credentials, hostnames
-
-Zeek (Bro): zeek -r network_traffic.pcapng
-- Generate detailed logs
-
-Snort: snort -r network_traffic.pcapng -c snort.conf
-- IDS analysis
-
-📚 Resources:
--------------
-- Wireshark User Guide: https://www.wireshark.org/docs/wsug_html/
-- Display Filter Reference: https://www.wireshark.org/docs/dfref/
-- Wireshark Tutorial: https://www.wireshark.org/docs/
-
-⚠️  Analysis Tips:
-------------------
-- Look for anomalies in normal traffic patterns
-- Check for connections to suspicious IPs/domains
-- Analyze timing patterns for beaconing
-- Extract and analyze transferred files
-- Correlate with other evidence (process list, timestamps)
-""")
+        try:
+            guide_file = self.output_dir / "wireshark_analysis_guide.txt"
+            guide_file.write_bytes(_WIRESHARK_GUIDE)
 
-            self.collected_files.append(guide_file)
+            collected.append(guide_file)
 
         except Exception as e:
             self.logger.error(
@@ -573,34 +604,48 @@ Snort: snort -r network_traffic.pcapng -c snort.conf
                 module="NetworkModule"
             )
 
+        return collected
+
+    def _hash_files(self, files: List[Path]):
+        algorithms = self.config.get("hash_algorithms", ["md5", "sha256"])
+        pending = [file_path for file_path in files if file_path not in self.file_hashes]
+        self.file_hashes.update(
+            self.hash_calculator.calculate_hashes_for_files(pending, algorithms)
+        )
+
     def _calculate_hashes(self):
         hash_file = self.output_dir / "hashes.txt"
+        stats = {}
+        for file_path in self.collected_files:
+            try:
+                stats[file_path] = file_path.stat()
+            except OSError:
+                continue
+
+        files = list(stats)
+        self._hash_files(files)
+        results = [self.file_hashes[file_path] for file_path in files]
 
         with open(hash_file, 'w', encoding='utf-8') as f:
-            f.write("File Hashes\n")
-            f.write("=" * 80 + "\n\n")
-
-            for file_path in self.collected_files:
-                if file_path.exists():
-                    hashes = self.hash_calculator.calculate_file_hashes(
-                        file_path,
-                        self.config.get("hash_algorithms", ["md5", "sha256"])
-                    )
+            lines = ["File Hashes\n", "=" * 80 + "\n\n"]
+
+            for file_path, hashes in zip(files, results):
+                lines.append(f"File: {file_path.name}\n")
+                for algo, hash_value in hashes.items():
+                    lines.append(f"  {algo.upper()}: {hash_value}\n")
+                lines.append("\n")
+
+                self.logger.log_collection(
+                    module="NetworkModule",
+                    action="File collected",
+                    status="Success",
+                    file_path=str(file_path),
+                    file_size=stats[file_path].st_size,
+                    hash_md5=hashes.get("md5", ""),
+                    hash_sha256=hashes.get("sha256", "")
+                )
 
-                    f.write(f"File: {file_path.name}\n")
-                    for algo, hash_value in hashes.items():
-                        f.write(f"  {algo.upper()}: {hash_value}\n")
-                    f.write("\n")
-
-                    self.logger.log_collection(
-                        module="NetworkModule",
-                        action="File collected",
-                        status="Success",
-                        file_path=str(file_path),
-                        file_size=file_path.stat().st_size,
-                        hash_md5=hashes.get("md5", ""),
-                        hash_sha256=hashes.get("sha256", "")
-                    )
+            f.write(''.join(lines))
 
     def cleanup(self) -> None:
         self.stop_capture = True
@@ -1,16 +1,119 @@
 import hashlib
+import io
+import mmap
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import BinaryIO, Dict, List, Optional
 from src.services.logger import get_logger
+from src.utils.file_io import open_sequential
+
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+
+HASH_FACTORIES = {
+    'md5': hashlib.md5,
+    'sha1': hashlib.sha1,
+    'sha256': hashlib.sha256
+}
+if blake3 is not None:
+    HASH_FACTORIES['blake3'] = lambda: blake3.blake3(max_threads=blake3.blake3.AUTO)
+
+# hashlib exposes OpenSSL's EVP constructors (SHA-NI / ARMv8 SHA dispatch) as
+# openssl_*; anything else is CPython's portable fallback implementation.
+OPENSSL_BACKED = hashlib.sha256.__name__.startswith('openssl_')
+if not OPENSSL_BACKED:
+    get_logger().warning(
+        "hashlib is not backed by OpenSSL; hashing will not use hardware SHA acceleration",
+        module="HashCalculator"
+    )
+
+
+_digest_executor_lock = threading.Lock()
+_digest_executor_instance: Optional[ThreadPoolExecutor] = None
+
+
+def _digest_executor() -> ThreadPoolExecutor:
+    # One process-wide pool for per-chunk digest updates. Its tasks never
+    # submit further work, so callers already running on other pools cannot
+    # deadlock on it.
+    global _digest_executor_instance
+    with _digest_executor_lock:
+        if _digest_executor_instance is None:
+            _digest_executor_instance = ThreadPoolExecutor(
+                max_workers=os.cpu_count() or 1, thread_name_prefix='digest'
+            )
+        return _digest_executor_instance
+
+
+class HashingWriter(io.BufferedIOBase):
+    """Binary stream that hashes everything written through it."""
+
+    def __init__(self, raw: BinaryIO, algorithms: List[str]):
+        super().__init__()
+        self._raw = raw
+        self._hash_objects = {alg: HASH_FACTORIES[alg]() for alg in algorithms}
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._raw.write(data)
+        for hash_obj in self._hash_objects.values():
+            hash_obj.update(data)
+        return len(data)
+
+    def flush(self) -> None:
+        if not self.closed:
+            self._raw.flush()
+
+    def close(self) -> None:
+        if not self.closed:
+            try:
+                super().close()
+            finally:
+                self._raw.close()
+
+    def hexdigests(self) -> Dict[str, str]:
+        return {alg: hash_obj.hexdigest() for alg, hash_obj in self._hash_objects.items()}
 
 
 class HashCalculator:
-    CHUNK_SIZE = 8192
+    CHUNK_SIZE = 4 * 1024 * 1024
+    # Files at least this large are dropped from the page cache once hashed
+    # so a multi-GB evidence image does not evict everything else.
+    DROP_CACHE_THRESHOLD = 256 * 1024 * 1024
 
     def __init__(self):
         """Initialize hash calculator."""
         self.logger = get_logger()
-        self.supported_algorithms = ['md5', 'sha1', 'sha256']
+        self.supported_algorithms = list(HASH_FACTORIES)
+
+    def _update_function(self, hash_objects: Dict[str, object], file_size: int):
+        """Return a function that feeds one chunk to every hash object.
+
+        For files of at least one chunk with several digests, each chunk is
+        hashed on all of them concurrently (hashlib releases the GIL), so the
+        file is still read only once.
+        """
+        if len(hash_objects) < 2 or file_size < self.CHUNK_SIZE or (os.cpu_count() or 1) < 2:
+            def update_all(chunk):
+                for hash_obj in hash_objects.values():
+                    hash_obj.update(chunk)
+
+            return update_all
+
+        executor = _digest_executor()
+
+        def update_all(chunk):
+            for _ in executor.map(lambda hash_obj: hash_obj.update(chunk), hash_objects.values()):
+                pass
+
+        return update_all
 
     def calculate_file_hashes(
         self,
@@ -21,6 +124,8 @@ class HashCalculator:
         if algorithms is None:
             algorithms = self.supported_algorithms
 
+        algorithms = list(dict.fromkeys(algorithms))
+
         invalid = [alg for alg in algorithms if alg not in self.supported_algorithms]
         if invalid:
             self.logger.warning(
@@ -42,32 +147,63 @@ class HashCalculator:
             file_size = file_path.stat().st_size
             bytes_processed = 0
 
-            hash_objects = {
-                'md5': hashlib.md5(),
-                'sha1': hashlib.sha1(),
-                'sha256': hashlib.sha256()
-            }
-
-            hash_objects = {alg: obj for alg, obj in hash_objects.items() if alg in algorithms}
+            hash_objects = {alg: HASH_FACTORIES[alg]() for alg in algorithms}
 
             self.logger.debug(
                 f"Calculating {', '.join(algorithms)} hashes for {file_path.name}",
                 module="HashCalculator"
             )
 
-            with open(file_path, 'rb') as f:
-                while True:
-                    chunk = f.read(self.CHUNK_SIZE)
-                    if not chunk:
-                        break
+            update_all = self._update_function(hash_objects, file_size)
+
+            with open(file_path, 'rb', opener=open_sequential) as f:
+                if hasattr(os, 'posix_fadvise'):
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+                try:
+                    mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except (ValueError, OSError):
+                    mapped = None
+
+                if mapped is not None:
+                    if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                        mapped.madvise(mmap.MADV_SEQUENTIAL)
+
+                    with mapped, memoryview(mapped) as view:
+                        if len(hash_objects) == 1 and progress_callback is None:
+                            # A single digest can consume the whole mapping in one
+                            # update call, keeping the loop inside OpenSSL.
+                            for hash_obj in hash_objects.values():
+                                hash_obj.update(view)
+                            bytes_processed = len(view)
 
-                    for hash_obj in hash_objects.values():
-                        hash_obj.update(chunk)
+                        for offset in range(bytes_processed, len(view), self.CHUNK_SIZE):
+                            with view[offset:offset + self.CHUNK_SIZE] as chunk:
+                                update_all(chunk)
 
-                    bytes_processed += len(chunk)
+                                bytes_processed += len(chunk)
 
-                    if progress_callback and file_size > 0:
-                        progress_callback(bytes_processed, file_size)
+                            if progress_callback and file_size > 0:
+                                progress_callback(bytes_processed, file_size)
+                elif len(hash_objects) == 1 and progress_callback is None:
+                    # Unmappable files with a single digest: hashlib.file_digest
+                    # runs the whole read/update loop in C.
+                    (alg,) = hash_objects
+                    hash_objects[alg] = hashlib.file_digest(f, HASH_FACTORIES[alg])
+                    bytes_processed = file_size
+                else:
+                    buffer = memoryview(bytearray(self.CHUNK_SIZE))
+                    while n := f.readinto(buffer):
+                        with buffer[:n] as chunk:
+                            update_all(chunk)
+
+                        bytes_processed += n
+
+                        if progress_callback and file_size > 0:
+                            progress_callback(bytes_processed, file_size)
+
+                if hasattr(os, 'posix_fadvise') and file_size >= self.DROP_CACHE_THRESHOLD:
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
 
             result = {alg: hash_obj.hexdigest() for alg, hash_obj in hash_objects.items()}
 
@@ -92,6 +228,25 @@ class HashCalculator:
             )
             return {}
 
+    def calculate_hashes_for_files(
+        self,
+        file_paths: List[Path],
+        algorithms: Optional[List[str]] = None
+    ) -> Dict[Path, Dict[str, str]]:
+        """Hash several files concurrently, one worker per file.
+
+        Results are keyed by path in the order given.
+        """
+        if not file_paths:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=min(len(file_paths), os.cpu_count() or 1)) as executor:
+            results = executor.map(
+                lambda file_path: self.calculate_file_hashes(file_path, algorithms),
+                file_paths
+            )
+            return dict(zip(file_paths, results))
+
     def verify_file_hash(
         self,
         file_path: Path,
@@ -0,0 +1,3 @@
+def console_to_utf8(data: bytes) -> bytes:
+    # Windows console tools write in the OEM code page; reports are UTF-8.
+    return data.decode('cp437').encode('utf-8')
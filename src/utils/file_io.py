@@ -0,0 +1,9 @@
+import os
+
+# Windows-only open flags (FILE_FLAG_SEQUENTIAL_SCAN via the CRT); 0 elsewhere.
+SEQUENTIAL_FLAGS = getattr(os, 'O_SEQUENTIAL', 0) | getattr(os, 'O_BINARY', 0)
+
+
+def open_sequential(path, flags):
+    # Opener for open(); the mode only applies when flags include O_CREAT.
+    return os.open(path, flags | SEQUENTIAL_FLAGS, 0o644)
@@ -0,0 +1,25 @@
+import json
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps_indented(data: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    # Two-space indent to match orjson, which only offers OPT_INDENT_2.
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def write_json(path: Path, data: Any) -> None:
+    Path(path).write_bytes(dumps_indented(data))
+
+
+def dumps_compact(data: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
@@ -1,8 +1,9 @@
+import hashlib
 import pytest
 from pathlib import Path
 import tempfile
 import shutil
-from src.services.hash_calculator import HashCalculator
+from src.services.hash_calculator import HashCalculator, HashingWriter
 
 
 class TestHashCalculator:
@@ -31,6 +32,51 @@ class TestHashCalculator:
         assert 'sha256' in hashes
         assert len(hashes) == 2
 
+    def test_multiple_hashes_match_single_algorithm_runs(self):
+        calc = HashCalculator()
+        combined = calc.calculate_file_hashes(self.test_file, ['md5', 'sha256', 'md5'])
+
+        assert combined == {
+            'md5': calc.calculate_file_hashes(self.test_file, ['md5'])['md5'],
+            'sha256': calc.calculate_file_hashes(self.test_file, ['sha256'])['sha256'],
+        }
+
+    def test_hashing_writer_matches_file_hashes(self):
+        output_file = self.temp_dir / "written.txt"
+
+        with HashingWriter(open(output_file, 'wb'), ['md5', 'sha256']) as writer:
+            writer.write(b"Hello, ")
+            writer.write(b"World!")
+
+        calc = HashCalculator()
+        assert writer.hexdigests() == calc.calculate_file_hashes(output_file, ['md5', 'sha256'])
+
+    def test_multi_chunk_file_with_several_digests(self):
+        data = bytes(range(256)) * (HashCalculator.CHUNK_SIZE // 256 * 2 + 3)
+        large_file = self.temp_dir / "large.bin"
+        large_file.write_bytes(data)
+
+        calc = HashCalculator()
+        hashes = calc.calculate_file_hashes(large_file, ['md5', 'sha1', 'sha256'])
+
+        assert hashes == {
+            'md5': hashlib.md5(data).hexdigest(),
+            'sha1': hashlib.sha1(data).hexdigest(),
+            'sha256': hashlib.sha256(data).hexdigest(),
+        }
+
+    def test_calculate_hashes_for_files(self):
+        other_file = self.temp_dir / "other.txt"
+        other_file.write_text("Goodbye")
+
+        calc = HashCalculator()
+        results = calc.calculate_hashes_for_files([other_file, self.test_file], ['md5'])
+
+        assert list(results) == [other_file, self.test_file]
+        assert results[self.test_file] == calc.calculate_file_hashes(self.test_file, ['md5'])
+        assert results[other_file] == {'md5': hashlib.md5(b"Goodbye").hexdigest()}
+        assert calc.calculate_hashes_for_files([], ['md5']) == {}
+
     def test_nonexistent_file(self):
         calc = HashCalculator()
         hashes = calc.calculate_file_hashes(Path("nonexistent.txt"))
@@ -58,3 +104,11 @@ class TestHashCalculator:
         assert 'md5' in algorithms
         assert 'sha1' in algorithms
         assert 'sha256' in algorithms
+
+    def test_calculate_blake3(self):
+        blake3 = pytest.importorskip("blake3")
+        calc = HashCalculator()
+        hashes = calc.calculate_file_hashes(self.test_file, ['blake3', 'sha256'])
+
+        assert hashes['blake3'] == blake3.blake3(b"Hello, World!").hexdigest()
+        assert 'sha256' in hashes
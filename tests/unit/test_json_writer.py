@@ -0,0 +1,65 @@
+import json
+import pytest
+from pathlib import Path
+import tempfile
+import shutil
+from src.utils import json_writer
+
+
+SAMPLE = {
+    "name": "café",
+    "pid": 4,
+    "cmdline": ["C:\\Windows\\System32\\svchost.exe", "-k", "netsvcs"],
+    "nested": {"ok": True, "missing": None},
+}
+
+requires_orjson = pytest.mark.skipif(json_writer.orjson is None, reason="orjson not installed")
+
+
+class TestJsonWriter:
+
+    def setup_method(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+
+    def teardown_method(self):
+        if self.temp_dir.exists():
+            shutil.rmtree(self.temp_dir)
+
+    def test_stdlib_indented_uses_two_spaces(self, monkeypatch):
+        monkeypatch.setattr(json_writer, "orjson", None)
+
+        output = json_writer.dumps_indented(SAMPLE)
+
+        assert output == json.dumps(SAMPLE, indent=2, ensure_ascii=False).encode('utf-8')
+
+    def test_stdlib_compact_has_no_whitespace(self, monkeypatch):
+        monkeypatch.setattr(json_writer, "orjson", None)
+
+        output = json_writer.dumps_compact(SAMPLE)
+
+        assert b"\n" not in output
+        assert b", " not in output
+        assert json.loads(output) == SAMPLE
+
+    def test_stdlib_write_json_round_trips(self, monkeypatch):
+        monkeypatch.setattr(json_writer, "orjson", None)
+        output_file = self.temp_dir / "out.json"
+
+        json_writer.write_json(output_file, SAMPLE)
+
+        assert json.loads(output_file.read_bytes()) == SAMPLE
+        assert "café".encode('utf-8') in output_file.read_bytes()
+
+    @requires_orjson
+    def test_orjson_indented_matches_stdlib(self, monkeypatch):
+        with_orjson = json_writer.dumps_indented(SAMPLE)
+        monkeypatch.setattr(json_writer, "orjson", None)
+
+        assert with_orjson == json_writer.dumps_indented(SAMPLE)
+
+    @requires_orjson
+    def test_orjson_compact_matches_stdlib(self, monkeypatch):
+        with_orjson = json_writer.dumps_compact(SAMPLE)
+        monkeypatch.setattr(json_writer, "orjson", None)
+
+        assert with_orjson == json_writer.dumps_compact(SAMPLE)
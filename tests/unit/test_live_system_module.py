@@ -0,0 +1,163 @@
+import csv
+import pytest
+import psutil
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from src.modules import live_system_module
+from src.modules.live_system_module import LiveSystemModule, _csv_field
+
+
+@pytest.mark.skipif(not sys.platform.startswith('linux'), reason="reads /proc directly")
+class TestProcProcesses:
+
+    def setup_method(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+
+    def teardown_method(self):
+        if self.temp_dir.exists():
+            shutil.rmtree(self.temp_dir)
+
+    def test_long_name_matches_psutil(self):
+        binary = self.temp_dir / "averyveryverylongprocessname"
+        shutil.copy(shutil.which("sleep"), binary)
+
+        process = subprocess.Popen([str(binary), "30"])
+        try:
+            infos = {info['pid']: info for info in live_system_module._iter_proc_processes()}
+
+            assert infos[process.pid]['name'] == "averyveryverylongprocessname"
+            assert infos[process.pid]['name'] == psutil.Process(process.pid).name()
+        finally:
+            process.kill()
+            process.wait()
+
+    def test_fields_match_psutil(self):
+        own = psutil.Process()
+        info = {
+            info['pid']: info for info in live_system_module._iter_proc_processes()
+        }[own.pid]
+
+        assert info['name'] == own.name()
+        assert info['exe'] == own.exe()
+        assert info['cmdline'] == own.cmdline()
+        assert info['ppid'] == own.ppid()
+        assert info['username'] == own.username()
+        assert info['num_threads'] == own.num_threads()
+        assert info['create_time'] == pytest.approx(own.create_time(), abs=1)
+
+
+class TestCsvField:
+
+    def test_plain_value_is_unquoted(self):
+        assert _csv_field("svchost.exe") == "svchost.exe"
+        assert _csv_field(42) == "42"
+
+    def test_none_is_empty(self):
+        assert _csv_field(None) == ""
+
+    @pytest.mark.parametrize("value", [
+        "a,b",
+        'say "hi"',
+        "line\nbreak",
+        "carriage\rreturn",
+    ])
+    def test_special_characters_round_trip(self, value):
+        field = _csv_field(value)
+
+        assert field.startswith('"') and field.endswith('"')
+        assert next(csv.reader([field])) == [value]
+
+
+class TestProcessesCsv:
+
+    def setup_method(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+
+    def teardown_method(self):
+        if self.temp_dir.exists():
+            shutil.rmtree(self.temp_dir)
+
+    def test_quoted_fields_parse_back(self, monkeypatch):
+        pinfo = {
+            'pid': 1234,
+            'name': 'evil, "quoted".exe',
+            'exe': 'C:\\Temp\\evil.exe',
+            'cmdline': ['evil.exe', '--arg=a,b', 'multi\nline'],
+            'ppid': 4,
+            'username': 'DOMAIN\\user',
+            'status': 'running',
+            'cpu_percent': 0.0,
+            'memory_info': None,
+            'num_threads': 3,
+            'create_time': 0,
+        }
+        monkeypatch.setattr(live_system_module, "_iter_process_info", lambda: iter([pinfo]))
+        module = LiveSystemModule({"output_dir": str(self.temp_dir)})
+
+        collected = module._collect_processes()
+
+        csv_file = self.temp_dir / "processes.csv"
+        assert csv_file in collected
+        with open(csv_file, newline='', encoding='utf-8') as f:
+            header, row = list(csv.reader(f))
+
+        assert len(row) == len(header)
+        assert row[:6] == [
+            '1234',
+            'evil, "quoted".exe',
+            'C:\\Temp\\evil.exe',
+            'evil.exe --arg=a,b multi\nline',
+            '4',
+            'DOMAIN\\user',
+        ]
+        assert row[-1] == 'N/A'
+
+
+class _FakeService:
+
+    def __init__(self, info):
+        self.info = info
+
+    def as_dict(self):
+        return self.info
+
+
+class TestServicesCsv:
+
+    def setup_method(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+
+    def teardown_method(self):
+        if self.temp_dir.exists():
+            shutil.rmtree(self.temp_dir)
+
+    def test_values_use_wmic_spellings(self, monkeypatch):
+        services = [
+            _FakeService({
+                'display_name': 'Windows Update',
+                'name': 'wuauserv',
+                'binpath': 'C:\\Windows\\system32\\svchost.exe -k netsvcs -p',
+                'start_type': 'manual',
+                'status': 'stopped',
+            }),
+            _FakeService({
+                'display_name': 'DHCP Client',
+                'name': 'Dhcp',
+                'binpath': 'C:\\Windows\\system32\\svchost.exe -k LocalServiceNetworkRestricted',
+                'start_type': 'automatic',
+                'status': 'start_pending',
+            }),
+        ]
+        monkeypatch.setattr(psutil, "win_service_iter", lambda: iter(services), raising=False)
+        module = LiveSystemModule({"output_dir": str(self.temp_dir)})
+
+        assert module._collect_services_detailed() == [self.temp_dir / "services.csv"]
+
+        with open(self.temp_dir / "services.csv", newline='', encoding='utf-8') as f:
+            header, *rows = list(csv.reader(f))
+
+        assert header == ['Node', 'DisplayName', 'Name', 'PathName', 'StartMode', 'State']
+        assert [row[4:] for row in rows] == [['Manual', 'Stopped'], ['Auto', 'Start Pending']]
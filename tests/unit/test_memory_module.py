@@ -0,0 +1,153 @@
+import hashlib
+import io
+import json
+import pytest
+import shutil
+import sys
+import tempfile
+import zlib
+from pathlib import Path
+from typing import Optional
+from src.modules.memory_module import MemoryModule, _WinPmemOutput, _volatility_profile
+
+
+PAYLOAD = bytes(range(256)) * 4096
+
+FAKE_WINPMEM = '''#!{python}
+import sys
+from pathlib import Path
+
+with open(Path(__file__).with_name("calls.log"), "a") as log:
+    log.write(" ".join(sys.argv[1:]) + "\\n")
+
+payload = bytes(range(256)) * 4096
+if sys.argv[1] == "--help":
+    print("Usage: winpmem.exe [option] [output path]")
+    if {stream_writes} is not None:
+        print("NOTE: an output filename of - will write the image to STDOUT.")
+elif sys.argv[1] == "-":
+    sys.stderr.write("Start 0x1000 - Length 0x2000\\n")
+    if {stream_writes}:
+        sys.stdout.buffer.write(payload)
+    sys.exit({stream_exit})
+else:
+    print("Start 0x1000 - Length 0x2000")
+    with open(sys.argv[1], "wb") as f:
+        f.write(payload)
+'''
+
+
+class TestVolatilityProfile:
+
+    @pytest.mark.parametrize("os_version, architecture, profile", [
+        ("Windows-10-10.0.19045-SP0", "AMD64", "Win10x64"),
+        ("Windows-10-10.0.19045-SP0", "x86_64", "Win10x64"),
+        ("Windows-10-10.0.19045-SP0", "x86", "Win10x86"),
+        ("Windows-11-10.0.22631-SP0", "ARM64", "Win10x64"),
+        ("Windows-7-6.1.7601-SP1", "AMD64", "WinXPSP2x86"),
+        ("Linux-6.1.0-x86_64", "x86_64", "WinXPSP2x86"),
+    ])
+    def test_profile(self, os_version, architecture, profile):
+        assert _volatility_profile(os_version, architecture) == profile
+
+
+class TestWinPmemOutput:
+
+    def test_keeps_every_memory_range(self):
+        ranges = [f"Start 0x{i:x}000 - Length 0x1000" for i in range(5000)]
+        stream = io.BytesIO(
+            b"Acquisition mode: PTE Remapping\n"
+            + "".join(f"{line}\n" for line in ranges).encode()
+        )
+        output = _WinPmemOutput()
+
+        output.drain(stream)
+
+        assert output.memory_ranges == ranges
+        assert output.acquisition_method == "PTE Remapping"
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="fake WinPmem is a POSIX script")
+class TestWinPmemAcquisition:
+
+    def setup_method(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.output_file = self.temp_dir / "memory.raw"
+
+    def teardown_method(self):
+        if self.temp_dir.exists():
+            shutil.rmtree(self.temp_dir)
+
+    def _module(self, monkeypatch):
+        module = MemoryModule({"output_dir": str(self.temp_dir)})
+        monkeypatch.setattr(module, "_expected_image_size", lambda: len(PAYLOAD) * 2)
+        return module
+
+    def _fake_winpmem(self, stream_writes: Optional[bool] = True, stream_exit: int = 0) -> Path:
+        winpmem = self.temp_dir / "winpmem.exe"
+        winpmem.write_text(FAKE_WINPMEM.format(
+            python=sys.executable, stream_writes=stream_writes, stream_exit=stream_exit
+        ))
+        winpmem.chmod(0o755)
+        return winpmem
+
+    def _calls(self) -> list:
+        return (self.temp_dir / "calls.log").read_text().splitlines()
+
+    def test_streamed_image_is_hashed_while_written(self, monkeypatch):
+        module = self._module(monkeypatch)
+
+        assert module._acquire_memory_with_winpmem(self._fake_winpmem(), self.output_file)
+
+        assert self.output_file.read_bytes() == PAYLOAD
+        assert module.image_sizes[self.output_file] == len(PAYLOAD)
+        hashes = module.image_hashes[self.output_file]
+        assert hashes["sha256"] == hashlib.sha256(PAYLOAD).hexdigest()
+        assert hashes["crc32"] == f"{zlib.crc32(PAYLOAD):08x}"
+        assert module.winpmem_output.memory_ranges == ["Start 0x1000 - Length 0x2000"]
+        assert self.output_file in module.collected_files
+
+    def test_falls_back_to_file_output(self, monkeypatch):
+        module = self._module(monkeypatch)
+        winpmem = self._fake_winpmem(stream_writes=False, stream_exit=1)
+
+        assert module._acquire_memory_with_winpmem(winpmem, self.output_file)
+
+        assert self.output_file.read_bytes() == PAYLOAD
+        assert self.output_file not in module.image_hashes
+        assert module.winpmem_output.memory_ranges == ["Start 0x1000 - Length 0x2000"]
+        assert self.output_file in module.collected_files
+
+    def test_failed_stream_leaves_no_image(self, monkeypatch):
+        module = self._module(monkeypatch)
+
+        assert module._stream_memory_with_winpmem(
+            self._fake_winpmem(stream_writes=False, stream_exit=1), self.output_file
+        ) is None
+        assert not self.output_file.exists()
+
+    def test_nonzero_exit_after_streaming_keeps_image(self, monkeypatch):
+        module = self._module(monkeypatch)
+
+        assert module._acquire_memory_with_winpmem(
+            self._fake_winpmem(stream_exit=1), self.output_file
+        )
+
+        assert self._calls() == ["--help", "-"]
+        assert self.output_file.read_bytes() == PAYLOAD
+        hashes = module.image_hashes[self.output_file]
+        assert hashes["sha256"] == hashlib.sha256(PAYLOAD).hexdigest()
+        metadata = json.loads((self.temp_dir / "acquisition_metadata.json").read_text())
+        assert metadata["return_code"] == 1
+        assert metadata["hashes"] == hashes
+
+    def test_usage_without_stdout_skips_streaming(self, monkeypatch):
+        module = self._module(monkeypatch)
+
+        assert module._acquire_memory_with_winpmem(
+            self._fake_winpmem(stream_writes=None), self.output_file
+        )
+
+        assert self._calls() == ["--help", str(self.output_file)]
+        assert self.output_file.read_bytes() == PAYLOAD
+        assert self.output_file not in module.image_hashes
@@ -0,0 +1,49 @@
+from src.modules.network_module import NetworkModule
+
+
+class TestConnectionRows:
+
+    def test_tcp_row_columns(self):
+        row = NetworkModule._TCP_ROW({
+            'type': 'TCP',
+            'local_addr': '10.0.0.5:49712',
+            'remote_addr': '93.184.216.34:443',
+            'status': 'ESTABLISHED',
+            'pid': 4242,
+            'process': 'chrome.exe',
+        })
+
+        assert row == (
+            f"{'10.0.0.5:49712':<30} {'93.184.216.34:443':<30} {'ESTABLISHED':<15} "
+            f"{'4242':<10} {'chrome.exe':<20}\n"
+        )
+
+    def test_udp_row_columns(self):
+        row = NetworkModule._UDP_ROW({
+            'type': 'UDP',
+            'local_addr': '0.0.0.0:53',
+            'pid': 1234,
+            'process': 'dns.exe',
+        })
+
+        assert row == f"{'0.0.0.0:53':<30} {'1234':<10} {'dns.exe':<20}\n"
+
+    def test_missing_pid_renders_placeholder(self):
+        row = NetworkModule._UDP_ROW({'local_addr': 'N/A', 'pid': 'N/A', 'process': 'N/A'})
+
+        assert row == f"{'N/A':<30} {'N/A':<10} {'N/A':<20}\n"
+
+    def test_rows_line_up_with_headers(self):
+        row = NetworkModule._TCP_ROW({
+            'local_addr': '127.0.0.1:8080',
+            'remote_addr': 'N/A',
+            'status': 'LISTEN',
+            'pid': 1,
+            'process': 'init',
+        })
+        header = (
+            f"{'Local Address':<30} {'Remote Address':<30} {'Status':<15} "
+            f"{'PID':<10} {'Process':<20}\n"
+        )
+
+        assert len(row) == len(header)